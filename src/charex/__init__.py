@@ -3,16 +3,61 @@ __init__
 ~~~~~~~~
 
 Initialization for the :mod:`charex` package.
+
+The public API is imported lazily. The submodules are only loaded
+the first time one of their names is used, so importing the package
+for one function doesn't pay to import all of them. The command line
+goes through :mod:`charex.shell`, which imports the submodules itself.
 """
-from charex.charex import (
-    Character, filter_by_property, get_properties, get_property_values,
-    expand_property, expand_property_value
-)
-from charex.charsets import get_codecs, get_description
-from charex.charsets import multidecode, multiencode
-from charex.denormal import count_denormalizations, denormalize
-from charex.denormal import gen_denormalize, gen_random_denormalize
-from charex.escape import get_schemes
-from charex.escape import escape as escape_text
-from charex.escape import reg_escape
-from charex.normal import get_forms, normalize, reg_form
+from importlib import import_module
+
+
+# The public names of the package and where they live.
+_api = {
+    'Character': ('charex.charex', 'Character'),
+    'filter_by_property': ('charex.charex', 'filter_by_property'),
+    'get_properties': ('charex.charex', 'get_properties'),
+    'get_property_values': ('charex.charex', 'get_property_values'),
+    'expand_property': ('charex.charex', 'expand_property'),
+    'expand_property_value': ('charex.charex', 'expand_property_value'),
+    'get_codecs': ('charex.charsets', 'get_codecs'),
+    'get_description': ('charex.charsets', 'get_description'),
+    'multidecode': ('charex.charsets', 'multidecode'),
+    'multiencode': ('charex.charsets', 'multiencode'),
+    'count_denormalizations': ('charex.denormal', 'count_denormalizations'),
+    'denormalize': ('charex.denormal', 'denormalize'),
+    'gen_denormalize': ('charex.denormal', 'gen_denormalize'),
+    'gen_random_denormalize': ('charex.denormal', 'gen_random_denormalize'),
+    'get_schemes': ('charex.escape', 'get_schemes'),
+    'escape_text': ('charex.escape', 'escape'),
+    'reg_escape': ('charex.escape', 'reg_escape'),
+    'get_forms': ('charex.normal', 'get_forms'),
+    'normalize': ('charex.normal', 'normalize'),
+    'reg_form': ('charex.normal', 'reg_form'),
+}
+__all__ = list(_api)
+
+
+def __getattr__(name: str) -> object:
+    """Import public names from their submodules on first use. Other
+    names are tried as submodules, so `charex.db` and the like work
+    without importing them first.
+    """
+    if name not in _api:
+        modname = f'{__name__}.{name}'
+        try:
+            return import_module(modname)
+        except ModuleNotFoundError as ex:
+            if ex.name != modname:
+                raise
+        msg = f'module {__name__!r} has no attribute {name!r}'
+        raise AttributeError(msg)
+    modname, attr = _api[name]
+    value = getattr(import_module(modname), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names along with the ones already loaded."""
+    return sorted(set(globals()) | set(_api))
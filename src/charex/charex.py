@@ -4,7 +4,8 @@ charex
 
 Tools for exploring unicode characters and other character sets.
 """
-from collections.abc import Generator, Sequence
+from collections.abc import Generator, Iterable
+from functools import lru_cache
 from typing import cast, Literal
 import re
 import unicodedata as ucd
@@ -17,6 +18,34 @@ from charex.escape import schemes
 # Global values.
 normalization_forms = ['NFC', 'NFD', 'NFKC', 'NFKD']
 
+# Values of the UnicodeData.txt properties for ASCII characters. They
+# haven't changed since Unicode 1.1, so they can be answered without
+# loading UnicodeData.txt. The Unicode 1.0 names of the control
+# characters aren't available in :mod:`unicodedata`, so na1 still goes
+# to the database.
+ASCII = tuple(chr(n) for n in range(0x80))
+ASCII_PROPS = {
+    'bc': tuple(ucd.bidirectional(c) for c in ASCII),
+    'bidi_m': tuple('Y' if ucd.mirrored(c) else 'N' for c in ASCII),
+    'ccc': tuple(str(ucd.combining(c)) for c in ASCII),
+    'decimal': tuple(str(ucd.decimal(c, '')) for c in ASCII),
+    'digit': tuple(str(ucd.digit(c, '')) for c in ASCII),
+    'dt': ('',) * len(ASCII),
+    'gc': tuple(ucd.category(c) for c in ASCII),
+    'isc': ('',) * len(ASCII),
+    'na': tuple(ucd.name(c, '<control>') for c in ASCII),
+    'nv': tuple(str(ucd.digit(c, '')) for c in ASCII),
+    'slc': tuple(
+        f'{ord(c.lower()):04X}' if c.isupper() else '' for c in ASCII
+    ),
+    'stc': tuple(
+        f'{ord(c.upper()):04X}' if c.islower() else '' for c in ASCII
+    ),
+    'suc': tuple(
+        f'{ord(c.upper()):04X}' if c.islower() else '' for c in ASCII
+    ),
+}
+
 
 # Common types.
 NormForms = Literal['NFC', 'NFD', 'NFKC', 'NFKD']
@@ -112,17 +141,31 @@ class Character:
         '0041'
 
     """
+    __slots__ = ('__value', '__code', '__props')
     cache = db.cache
 
     def __init__(self, value: bytes | int | str) -> None:
         value = util.to_char(value)
         self.__value = value
-        self._rev_normal_cache: dict[str, tuple[str, ...]] = {}
+        self.__code = util.to_code(value)
+        self.__props: dict[str, str] | None = None
 
     def __getattr__(self, name):
-        name = name.casefold()
-        code = self.code_point[2:].casefold()
-        return db.get_value_for_code(name, code)
+        # The Unicode data doesn't change, so keep the values that
+        # have been looked up rather than querying the database again.
+        if self.__props is None:
+            self.__props = {}
+        elif name in self.__props:
+            return self.__props[name]
+
+        prop = name.casefold()
+        n = ord(self.__value)
+        if n < 0x80 and prop in ASCII_PROPS:
+            value = ASCII_PROPS[prop][n]
+        else:
+            value = db.get_value_for_code(prop, self.__code)
+        self.__props[name] = value
+        return value
 
     def __repr__(self) -> str:
         name = self.na
@@ -134,7 +177,7 @@ class Character:
     @property
     def code_point(self) -> str:
         """The address for the character in the Unicode database."""
-        return util.to_code(self.value, 'U+').upper()
+        return 'U+' + self.__code.upper()
 
     @property
     def value(self) -> str:
@@ -165,8 +208,7 @@ class Character:
 
         """
         prop = f'rev_{form}'
-        code = self.code_point[2:].casefold()
-        return db.get_denormal_map_for_code(prop, code)
+        return db.get_denormal_map_for_code(prop, self.__code)
 
     def escape(self, scheme: str, codec: str = 'utf8') -> str:
         """The escaped version of the character.
@@ -189,9 +231,13 @@ class Character:
             '&nvlt;'
 
         """
+        # Schemes are usually already given in lower case, so only
+        # casefold the ones that aren't found.
+        fn = schemes.get(scheme)
+        if fn is None:
+            fn = schemes[scheme.casefold()]
+
         try:
-            scheme = scheme.casefold()
-            fn = schemes[scheme]
             return fn(self.value, codec)
 
         # UTF-16 surrogates will error when anything tries to
@@ -222,8 +268,7 @@ class Character:
         """
         try:
             b = self.value.encode(codec)
-            hexes = [f'{x:02x}'.upper() for x in b]
-            return ' '.join(x for x in hexes)
+            return b.hex(' ').upper()
 
         # UTF-16 surrogates will error when anything tries to
         # encode them as UTF-8.
@@ -297,12 +342,7 @@ class Character:
 
 
 # Utility functions.
-def alias_property(longname: str, space: bool = True) -> str:
-    if space:
-        longname = longname.replace(' ', '_')
-    return Character.cache.props[longname.casefold()].alias
-
-
+@lru_cache(maxsize=512)
 def expand_property(prop: str) -> str:
     """Translate the short name of a Unicode property into the long
     name for that property.
@@ -325,6 +365,7 @@ def expand_property(prop: str) -> str:
     return long
 
 
+@lru_cache(maxsize=2048)
 def expand_property_value(prop: str, alias: str) -> str:
     """Translate the short name of a Unicode property value into the
     long name for that property.
@@ -353,7 +394,7 @@ def expand_property_value(prop: str, alias: str) -> str:
 def filter_by_property(
     prop: str,
     value: str,
-    chars: Sequence[Character] | None = None,
+    chars: Iterable[Character] | None = None,
     insensitive: bool = False,
     regex: bool = False
 ) -> Generator[Character, None, None]:
@@ -472,51 +513,67 @@ def filter_by_property(
         on 1,114,111 characters. In other words, it's not the speediest
         thing in the world.
     """
-    # Default to searching the full set of Unicode code points.
-    if not chars:
-        chars = [Character(n) for n in range(util.LEN_UNICODE)]
-
-    # Regular expression matching.
+    # Build the test for the values of the property.
     if regex:
         flags = 0
         if insensitive:
             flags = re.IGNORECASE
         pattern = re.compile(value, flags=flags)
-        for char in chars:
-            try:
-                if pattern.match(getattr(char, prop)):
-                    yield char
-            except KeyError:
-                continue
-
-    # Case-insensitive string matching.
+
+        def test(v: str) -> bool:
+            return pattern.match(v) is not None
+
     elif insensitive:
-        value = value.casefold()
-        for char in chars:
-            try:
-                if getattr(char, prop).casefold() == value:
-                    yield char
-            except KeyError:
-                continue
-
-    # String matching.
+        folded = value.casefold()
+
+        def test(v: str) -> bool:
+            return v.casefold() == folded
+
     else:
-        for char in chars:
-            try:
-                if getattr(char, prop) == value:
-                    yield char
-            except KeyError:
-                continue
+        def test(v: str) -> bool:
+            return v == value
 
+    # When searching all of Unicode, the database can search for the
+    # values without building a Character for every code point.
+    if not chars:
+        codes = db.find_codes_by_value(prop.casefold(), test)
+        if codes is not None:
+            for n in codes:
+                yield Character(n)
+            return
+
+        # Otherwise the code points are created as they are searched,
+        # so only the matches are kept.
+        chars = (Character(n) for n in range(util.LEN_UNICODE))
 
-def get_category_members(category: str) -> tuple[Character, ...]:
-    """Get all characters that are members of the given category."""
-    ulen = 0x10FFFF
-    members = (
-        Character(n) for n in range(ulen)
-        if ucd.category(chr(n)) == category
-    )
-    return tuple(members)
+    for char in chars:
+        try:
+            if test(getattr(char, prop)):
+                yield char
+        except KeyError:
+            continue
+
+
+@lru_cache(maxsize=4096)
+def get_character(value: str) -> Character:
+    """Get a shared :class:`charex.Character` for the given character.
+    The same characters tend to be looked up again and again, so the
+    objects and the property values they have already looked up are
+    reused.
+
+    :param value: The character.
+    :return: The character as a :class:`charex.Character`.
+    :rtype: charex.Character
+
+    Usage
+    -----
+    To get the :class:`charex.Character` for a character::
+
+        >>> get_character('a') is get_character('a')
+        True
+
+    """
+    return Character(value)
 
 
 def get_properties() -> tuple[str, ...]:
@@ -535,9 +592,9 @@ def get_properties() -> tuple[str, ...]:
     """
     props = Character.cache.property_alias
     result = []
-    for key in props:
-        if props[key] not in result:
-            result.append(props[key])
+    for prop in props.values():
+        if prop not in result:
+            result.append(prop)
     aliases = tuple(prop.alias for prop in result)
     saliases = sorted(alias.casefold() for alias in aliases)
     return tuple(saliases)
@@ -561,9 +618,9 @@ def get_property_values(prop: str) -> tuple[str, ...]:
     """
     propvals = Character.cache.value_aliases[prop]
     result = []
-    for key in propvals:
-        if propvals[key] not in result:
-            result.append(propvals[key])
+    for val in propvals.values():
+        if val not in result:
+            result.append(val)
     return tuple(val.alias for val in result)
 
 
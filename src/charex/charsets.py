@@ -4,8 +4,10 @@ charsets
 
 Data and functions for working with character sets.
 """
-from collections.abc import Iterator
+from codecs import CodecInfo, lookup
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
 from sys import byteorder
 
 from charex import util
@@ -540,6 +542,27 @@ codecs = {
 
 
 # Functions.
+@lru_cache(maxsize=256)
+def get_codec_info(codeckey: str) -> CodecInfo:
+    """Look up the encoder and decoder for the given codec. The
+    lookups are cached, so decoding or encoding in every codec doesn't
+    go back through the codec registry each time.
+
+    :param codeckey: The key for the codec.
+    :return: The codec as a :class:`codecs.CodecInfo`.
+    :rtype: codecs.CodecInfo
+
+    Usage
+    -----
+    To get the codec information for the given codec key::
+
+        >>> get_codec_info('ascii')  # doctest: +ELLIPSIS
+        <codecs.CodecInfo object for encoding ascii at...>
+
+    """
+    return lookup(codeckey)
+
+
 def get_codecs() -> tuple[str, ...]:
     """Return the keys of the registered codecs.
 
@@ -553,7 +576,7 @@ def get_codecs() -> tuple[str, ...]:
         >>> get_codecs()                        # +ELLIPSIS
         ('ascii', 'big5', 'big5hkscs', 'cp037'... 'utf_8', 'utf_8_sig')
     """
-    return tuple(codec for codec in codecs)
+    return tuple(codecs)
 
 
 def get_description(codeckey: str) -> str:
@@ -577,7 +600,7 @@ def get_description(codeckey: str) -> str:
 
 def multidecode(
     value: int | str | bytes,
-    codecs_: Iterator[str] | None = None
+    codecs_: Iterable[str] | None = None
 ) -> dict[str, str]:
     """Provide the character for the given address for each of the
     given character sets.
@@ -624,20 +647,18 @@ def multidecode(
     # Decode the value into the character sets.
     results = {}
     if codecs_ is None:
-        codecs_ = (codec for codec in get_codecs())
+        codecs_ = get_codecs()
     for codec in codecs_:
-        b = value
-
         # Pad for 2 or 4 byte codecs.
-        while len(b) < codecs[codec].size:
-            if codecs[codec].endian == 'little':
-                b = b + b'\x00'
-            else:
-                b = b'\x00' + b
+        details = codecs[codec]
+        if details.endian == 'little':
+            b = value.ljust(details.size, b'\x00')
+        else:
+            b = value.rjust(details.size, b'\x00')
 
         # Decode.
         try:
-            results[codec] = b.decode(codec)
+            results[codec] = get_codec_info(codec).decode(b)[0]
         except UnicodeDecodeError:
             results[codec] = ''
     return results
@@ -645,7 +666,7 @@ def multidecode(
 
 def multiencode(
     value: bytes | int | str,
-    codecs_: Iterator[str] | None = None
+    codecs_: Iterable[str] | None = None
 ) -> dict[str, bytes]:
     """Provide the address for the given character for each of the
     given character sets.
@@ -690,11 +711,11 @@ def multiencode(
     """
     value = util.to_char(value)
     if codecs_ is None:
-        codecs_ = (codec for codec in get_codecs())
+        codecs_ = get_codecs()
     results = {}
     for codec in codecs_:
         try:
-            results[codec] = value.encode(codec)
+            results[codec] = get_codec_info(codec).encode(value)[0]
         except UnicodeEncodeError:
             results[codec] = b''
     return results
@@ -5,11 +5,9 @@ cmds
 Core logic for the different commands/modes of :mod:`charex`.
 """
 from collections.abc import Callable, Generator, Sequence
-from functools import partial
+from functools import lru_cache, partial
 from itertools import zip_longest
-from textwrap import wrap
-
-from blessed import Terminal
+from textwrap import TextWrapper
 
 from charex import charex as ch
 from charex import charsets as cset
@@ -20,6 +18,13 @@ from charex import normal as nml
 from charex import util
 
 
+# The width of the codec column in the output of cd and ce.
+CODEC_WIDTH = max(len(codec) for codec in cset.get_codecs())
+
+# Separates the lines of a reverse normalization in the output of dt.
+REV_NORMAL_SEP = '\n' + ' ' * 23
+
+
 # Command functions.
 def cd(address: str) -> Generator[str, None, None]:
     """Decode the given address in all codecs.
@@ -30,25 +35,20 @@ def cd(address: str) -> Generator[str, None, None]:
     """
     # Get the data.
     codecs = cset.get_codecs()
-    results = cset.multidecode(address, (codec for codec in codecs))
+    results = cset.multidecode(address, codecs)
 
     # Write the output.
-    width = max(len(codec) for codec in codecs)
-    for key in results:
-        c = results[key]
-        details = ''
-        if len(c) < 1:
-            details = '*** no character ***'
-        elif len(c) > 1:
+    fmt = f'{{:>{CODEC_WIDTH}}}: {{}} {{}}'.format
+    for key, c in results.items():
+        if not c:
+            yield fmt(key, '', '*** no character ***')
+            continue
+        if len(c) > 1:
             details = '*** multiple characters ***'
         else:
-            char = ch.Character(c)
-            name = char.na
-            if name == '<control>':
-                name = f'<{char.na1}>'
-            details = f'{char.code_point} {name}'
+            details = describe_character(c)
         c = util.neutralize_control_characters(c)
-        yield f'{key:>{width}}: {c} {details}'
+        yield fmt(key, c, details)
 
 
 def ce(base: str) -> Generator[str, None, None]:
@@ -60,14 +60,13 @@ def ce(base: str) -> Generator[str, None, None]:
     """
     # Get the data.
     codecs = cset.get_codecs()
-    results = cset.multiencode(base, (codec for codec in codecs))
+    results = cset.multiencode(base, codecs)
 
     # Write the output.
-    width = max(len(codec) for codec in codecs)
-    for key in results:
-        if b := results[key]:
-            c = ' '.join(f'{n:>02x}'.upper() for n in b)
-            yield f'{key:>{width}}: {c}'
+    fmt = f'{{:>{CODEC_WIDTH}}}: {{}}'.format
+    for key, b in results.items():
+        if b:
+            yield fmt(key, b.hex(' ').upper())
 
 
 def cl(show_descr: bool = False) -> Generator[str, None, None]:
@@ -96,7 +95,7 @@ def ct(base: str, form: str, maxdepth: int, number: int = 0) -> str:
     """
     if number:
         return f'{number:,}'
-    count = dnm.count_denormalizations(base, form, maxdepth)
+    count = count_denormalizations(base, form, maxdepth)
     return f'{count:,}'
 
 
@@ -144,23 +143,6 @@ def dt(c: str) -> Generator[str, None, None]:
     """
     width = 35
 
-    def rev_normalize(char: ch.Character, form: str) -> str:
-        points = char.denormalize(form)
-        values = []
-        for point in points:
-            if len(point) == 1:
-                c = ch.Character(point)
-                values.append(c.summarize())
-            elif len(point) > 1:
-                values.append(f'{point} *** multiple characters ***')
-                for item in point:
-                    char = ch.Character(item)
-                    values.append('  ' + char.summarize())
-        if not values:
-            return ''
-        result = ('\n' + ' ' * 23).join(v for v in values)
-        return '\n' + ' ' * 23 + result + '\n'
-
     def make_prop_line(
         prop: str,
         char: ch.Character
@@ -182,25 +164,8 @@ def dt(c: str) -> Generator[str, None, None]:
         return result
 
     # Gather the details for display.
-    char = ch.Character(c)
+    char = ch.get_character(c)
     kmap = char.cache.kind_map
-    omap = {
-        'encoding': (val for val in (
-            ('UTF-8', char.encode('utf8')),
-            ('UTF-16', char.encode('utf_16_be')),
-            ('UTF-32', char.encode('utf_32_be')),
-            ('C encoded', char.escape('c')),
-            ('URL encoded', char.escape('url')),
-            ('HTML encoded', char.escape('html')),
-        )),
-        'denormal': (val for val in (
-            ('Reverse Cfold', rev_normalize(char, 'casefold')),
-            ('Reverse NFC', rev_normalize(char, 'nfc')),
-            ('Reverse NFD', rev_normalize(char, 'nfd')),
-            ('Reverse NFKC', rev_normalize(char, 'nfkc')),
-            ('Reverse NFKD', rev_normalize(char, 'nfkd')),
-        ))
-    }
 
     # Yield the display.
     yield (' ' * 10 + char.summarize())
@@ -214,12 +179,12 @@ def dt(c: str) -> Generator[str, None, None]:
             if value:
                 yield f'{label:>{width}}: {value}'
         yield ''
-    for kind in omap:
+    fmt = f'{{:>{width}}}: {{}}'.format
+    for kind, details in DETAILS.items():
         yield f'{"---":>{width}}  {kind.title()}'
-        for rec in omap[kind]:
-            label, value = rec
-            if value:
-                yield f'{label:>{width}}: {value}'
+        for label, get_value in details:
+            if value := get_value(char):
+                yield fmt(label, value)
         yield ''
 
 
@@ -274,16 +239,13 @@ def nl(form: str, base: str, expand: bool = False) -> str:
     :rtype: str
     """
     result = nml.normalize(form, base)
-    out = result
-    if expand:
-        out += '\n'
-        for item in result:
-            char = ch.Character(item)
-            indent = '  '
-            if 'mark' in char.gc.casefold():
-                indent += ' '
-            out += f'  {char.summarize()}\n'
-    return out
+    if not expand:
+        return result
+
+    lines = [result,]
+    for item in result:
+        lines.append(f'  {summarize_character(item)}')
+    return '\n'.join(lines) + '\n'
 
 
 def ns(row_shade: bool = True) -> Generator[str, None, None]:
@@ -295,6 +257,9 @@ def ns(row_shade: bool = True) -> Generator[str, None, None]:
     :return: Yields each named sequence as a :class:`str`.
     :rtype: str
     """
+    # blessed is slow to import, so only import it when needed.
+    from blessed import Terminal
+
     term = Terminal()
     for i, ns in enumerate(db.get_named_sequences()):
         line = ''
@@ -339,6 +304,9 @@ def sv(row_shade: bool = True) -> Generator[str, None, None]:
     :return: Yields each standardized variant as a :class:`str`.
     :rtype: str
     """
+    # blessed is slow to import, so only import it when needed.
+    from blessed import Terminal
+
     term = Terminal()
     for i, svar in enumerate(db.get_standardized_variant()):
         line = ''
@@ -389,6 +357,70 @@ def vn() -> Generator[str, None, None]:
 
 
 # Utility functions.
+@lru_cache(maxsize=128)
+def count_denormalizations(base: str, form: str, maxdepth: int) -> int:
+    """Count the denormalizations of the given string. Results are
+    cached, so repeating a count in the shell is free.
+
+    :param base: The base normalized string.
+    :param form: The Unicode normalization form for the denormalization.
+    :param maxdepth: Maximum number of reverse normalizations to use
+        for each character.
+    :return: The number of denormalizations as an :class:`int`.
+    :rtype: int
+    """
+    return dnm.count_denormalizations(base, form, maxdepth)
+
+
+@lru_cache(maxsize=1024)
+def describe_character(c: str) -> str:
+    """Give the code point and name of a character. Most codecs
+    decode an address to the same few characters, so the results
+    are cached.
+
+    :param c: The character to describe.
+    :return: The description as a :class:`str`.
+    :rtype: str
+    """
+    char = ch.get_character(c)
+    name = char.na
+    if name == '<control>':
+        name = f'<{char.na1}>'
+    return f'{char.code_point} {name}'
+
+
+@lru_cache(maxsize=4096)
+def encode_hex(c: str, codec: str) -> str:
+    """The hexadecimal value for the character in one of the
+    encodings shown by dt.
+
+    :param c: The character to encode.
+    :param codec: The codec to use.
+    :return: A :class:`str` with the encoded character.
+    :rtype: str
+    """
+    # UTF-16 surrogates will error when anything tries to
+    # encode them as UTF-8.
+    try:
+        b, _ = cset.get_codec_info(codec).encode(c)
+    except UnicodeEncodeError:
+        return ''
+    return b.hex(' ').upper()
+
+
+@lru_cache(maxsize=16)
+def get_wrapper(width: int) -> TextWrapper:
+    """Get a :class:`textwrap.TextWrapper` for the given width.
+    Rows in a list share the same column widths, so the wrappers are
+    built once and reused rather than rebuilt for every row.
+
+    :param width: The width to wrap text to.
+    :return: The wrapper as a :class:`textwrap.TextWrapper`.
+    :rtype: textwrap.TextWrapper
+    """
+    return TextWrapper(width)
+
+
 def make_description_row(name: str, namewidth: int, descr: str) -> str:
     """Create a two column row with a name and description.
 
@@ -398,8 +430,8 @@ def make_description_row(name: str, namewidth: int, descr: str) -> str:
     :return: The row as a :class:`str`.
     :rtype: str
     """
-    name_lines = wrap(name, namewidth)
-    descr_lines = wrap(descr, 77 - namewidth)
+    name_lines = get_wrapper(namewidth).wrap(name)
+    descr_lines = get_wrapper(77 - namewidth).wrap(descr)
     lines = (
         f'{n:<{namewidth}}  {d}'
         for n, d in zip_longest(name_lines, descr_lines, fillvalue='')
@@ -407,6 +439,47 @@ def make_description_row(name: str, namewidth: int, descr: str) -> str:
     return '\n'.join(lines)
 
 
+@lru_cache(maxsize=4096)
+def rev_normalize(c: str, form: str) -> str:
+    """Describe the characters that normalize to the given character.
+    Results are cached, so repeated lookups of the same character in
+    the shell don't repeat the work.
+
+    :param c: The character to reverse normalize.
+    :param form: The normalization form to reverse.
+    :return: The description of the reverse normalizations as a
+        :class:`str`.
+    :rtype: str
+    """
+    points = ch.get_character(c).denormalize(form)
+    if not points:
+        return ''
+
+    values = []
+    for point in points:
+        if len(point) == 1:
+            values.append(summarize_character(point))
+        elif len(point) > 1:
+            values.append(f'{point} *** multiple characters ***')
+            for item in point:
+                values.append('  ' + summarize_character(item))
+    if not values:
+        return ''
+    return REV_NORMAL_SEP + REV_NORMAL_SEP.join(values) + '\n'
+
+
+@lru_cache(maxsize=4096)
+def summarize_character(c: str) -> str:
+    """Summarize a character for display. Normalized strings tend to
+    repeat characters, so each character is only summarized once.
+
+    :param c: The character to summarize.
+    :return: The summary as a :class:`str`.
+    :rtype: str
+    """
+    return ch.get_character(c).summarize()
+
+
 def write_list(
     items: Sequence[str],
     get_descr: Callable[[str], str],
@@ -425,14 +498,38 @@ def write_list(
     if not items:
         items = ('No values.',)
         show_descr = False
+    if not show_descr:
+        yield from items
+        return
+
+    # The column width is only needed when descriptions are shown.
     width = max(len(item) for item in items)
     for item in items:
-        if show_descr:
-            descr = get_descr(item)
-            row = make_description_row(item, width, descr)
-            yield row
-        else:
-            yield item
+        descr = get_descr(item)
+        row = make_description_row(item, width, descr)
+        yield row
+
+
+# Details shown by dt that aren't Unicode properties. The values are
+# only computed when the line is displayed. This is defined after the
+# helpers it calls so their types are known.
+DETAILS = {
+    'encoding': (
+        ('UTF-8', lambda char: encode_hex(char.value, 'utf8')),
+        ('UTF-16', lambda char: encode_hex(char.value, 'utf_16_be')),
+        ('UTF-32', lambda char: encode_hex(char.value, 'utf_32_be')),
+        ('C encoded', lambda char: char.escape('c')),
+        ('URL encoded', lambda char: char.escape('url')),
+        ('HTML encoded', lambda char: char.escape('html')),
+    ),
+    'denormal': (
+        ('Reverse Cfold', lambda char: rev_normalize(char.value, 'casefold')),
+        ('Reverse NFC', lambda char: rev_normalize(char.value, 'nfc')),
+        ('Reverse NFD', lambda char: rev_normalize(char.value, 'nfd')),
+        ('Reverse NFKC', lambda char: rev_normalize(char.value, 'nfkc')),
+        ('Reverse NFKD', lambda char: rev_normalize(char.value, 'nfkd')),
+    ),
+}
 
 
 if __name__ == '__main__':
@@ -4,15 +4,20 @@ db
 
 Tools for reading the Unicode database and related information.
 """
+from array import array
 from bisect import bisect
 from collections import defaultdict
-from collections.abc import Callable, Generator, Sequence
-from dataclasses import dataclass
+from collections.abc import (
+    Callable, Generator, Iterable, Iterator, Mapping, Sequence, Set
+)
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from importlib.resources import as_file, files
 from importlib.resources.abc import Traversable
-from json import JSONDecoder, load, loads
+from json import load, loads
 from pathlib import Path
-from typing import Any, TypeVar
+from sys import intern
+from typing import TypeVar, cast
 from zipfile import ZipFile
 
 from charex import util
@@ -24,6 +29,8 @@ FILE_PATH_MAP = 'path_map.json'
 FILE_PROP_MAP = 'prop_map.json'
 PATH_PROPERTY_ALIASES = 'propertyaliases'
 PATH_VALUE_ALIASES = 'propertyvaluealiases'
+STAGE_SHIFT = 8
+STAGE_SIZE = 1 << STAGE_SHIFT
 UCD_RANGES = defaultdict(str, {
     0x3400: 'CJK UNIFIED IDEOGRAPH-',
     0x4e00: 'CJK UNIFIED IDEOGRAPH-',
@@ -45,14 +52,14 @@ UCD_RANGES = defaultdict(str, {
 
 
 # Data record structures.
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class BidiBracket:
     code: str = ''
     bpb: str = '<none>'
     bpt: str = 'n'
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class Casefold:
     c: str = '<code>'
     f: str = '<code>'
@@ -60,7 +67,7 @@ class Casefold:
     t: str = '<code>'
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class EmojiSource:
     code: str = ''
     docomo: str = ''
@@ -68,21 +75,21 @@ class EmojiSource:
     softbank: str = ''
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class Entity:
     name: str
     codepoints: tuple[str, ...]
     characters: str
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class Kind:
     load: Callable
     cache: dict
     action: str
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class PathInfo:
     path: str
     archive: str
@@ -90,34 +97,34 @@ class PathInfo:
     delim: str
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class PropertyAlias:
     alias: str
     name: str
     other: tuple[str, ...]
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class NameAlias:
     code: str
     alias: str
     kind: str
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class NamedSequence:
     name: str = ''
     codes: str = ''
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class Radical:
     name: str
     kangxi: str
     cjk: str
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class SpecialCase:
     code: str = ''
     lc: str = ''
@@ -126,7 +133,7 @@ class SpecialCase:
     condition_list: str = ''
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class UCD:
     """A record from the UnicodeData.txt file for Unicode 14.0.0.
 
@@ -174,14 +181,57 @@ class UCD:
     stc: str
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
+class StageTable:
+    """A two-stage lookup table of property values by code point.
+
+    The code points are split into blocks of STAGE_SIZE. The first
+    stage gives the position of the block for a code point in the
+    second stage, and the second stage gives the index of the value
+    for each code point. Blocks that are identical, such as the large
+    unassigned areas, are only stored once.
+
+    :param stage1: The offsets of the blocks in stage2.
+    :param stage2: The indexes of the values.
+    :param values: The property values.
+    """
+    stage1: Sequence[int]
+    stage2: Sequence[int]
+    values: tuple[str, ...]
+
+    def __getitem__(self, n: int) -> str:
+        offset = self.stage1[n >> STAGE_SHIFT]
+        return self.values[self.stage2[offset + (n & STAGE_SIZE - 1)]]
+
+    def find(self, test: Callable[[str], bool]) -> Iterator[int]:
+        """Find the code points with values that pass the test, in
+        order. Each value and each distinct block is only checked
+        once, rather than checking every code point.
+        """
+        hits = {i for i, value in enumerate(self.values) if test(value)}
+        if not hits:
+            return
+
+        found: dict[int, list[int]] = {}
+        for i, offset in enumerate(self.stage1):
+            if offset not in found:
+                block = self.stage2[offset:offset + STAGE_SIZE]
+                found[offset] = [
+                    n for n, index in enumerate(block) if index in hits
+                ]
+            base = i << STAGE_SHIFT
+            for n in found[offset]:
+                yield base + n
+
+
+@dataclass(repr=True, eq=True, slots=True)
 class URL:
     """A URL used in the Unicode standard."""
     name: str
     address: str
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class ValueAlias:
     property: str
     alias: str
@@ -189,7 +239,7 @@ class ValueAlias:
     other: tuple[str, ...]
 
 
-@dataclass(eq=True, order=True)
+@dataclass(eq=True, order=True, slots=True)
 class ValueRange:
     start: int
     stop: int
@@ -202,14 +252,14 @@ class ValueRange:
         return f'{cls}({start}, {stop}, {self.value!r})'
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class Variant:
     code: str = ''
     description: str = ''
     environments: str = ''
 
 
-@dataclass(repr=True, eq=True)
+@dataclass(repr=True, eq=True, slots=True)
 class Version:
     """A version of Unicode."""
     version: tuple[int, ...]
@@ -220,8 +270,290 @@ class Version:
     other: URL | None
 
 
+# Data maps.
+class CodeRanges(Set[str]):
+    """A set of code points stored as ranges rather than as the
+    individual code points. Membership is checked with a binary
+    search of the starts of the ranges.
+
+    :param ranges: The ranges as pairs of start and stop. The stop
+        is not in the range.
+    """
+    def __init__(self, ranges: Iterable[tuple[int, int]]) -> None:
+        merged: list[list[int]] = []
+        for start, stop in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], stop)
+            else:
+                merged.append([start, stop])
+        self.__starts = array('L', (start for start, _ in merged))
+        self.__stops = array('L', (stop for _, stop in merged))
+
+    def __contains__(self, code: object) -> bool:
+        try:
+            n = int(cast(str, code), 16)
+        except (TypeError, ValueError):
+            return False
+        index = bisect(self.__starts, n) - 1
+        return index >= 0 and n < self.__stops[index]
+
+    def __iter__(self) -> Iterator[str]:
+        for start, stop in zip(self.__starts, self.__stops):
+            for n in range(start, stop):
+                yield util.to_code(n)
+
+    def __len__(self) -> int:
+        return sum(self.__stops) - sum(self.__starts)
+
+    def find(self, inside: bool, outside: bool) -> Iterator[int]:
+        """Find the code points inside of the ranges, outside of the
+        ranges, or both, in order.
+        """
+        last = 0
+        for start, stop in zip(self.__starts, self.__stops):
+            if outside:
+                yield from range(last, start)
+            if inside:
+                yield from range(start, stop)
+            last = stop
+        if outside:
+            yield from range(last, util.LEN_UNICODE)
+
+
+class DenormalMap(Mapping[str, tuple[str, ...]]):
+    """The denormalizations of strings, keyed by the code points of
+    the string.
+
+    The map keeps the data the way it is stored, keyed by the strings
+    themselves, and only converts a key when it is looked up. That
+    saves converting thousands of keys every time a map is loaded,
+    when only a handful of them will ever be used. Converted values
+    are kept, so repeated lookups share the same tuple.
+
+    :param data: The denormalizations keyed by the normalized string.
+    """
+    def __init__(self, data: dict[str, list[str]]) -> None:
+        self.__data = data
+        self.__values: dict[str, tuple[str, ...]] = {}
+
+    def __getitem__(self, code: str) -> tuple[str, ...]:
+        if code not in self.__values:
+            key = ''.join(chr(int(n, 16)) for n in code.split())
+            self.__values[code] = tuple(self.__data[key])
+        return self.__values[code]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.__data:
+            yield ' '.join(util.to_code(c) for c in key)
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+
+class UnicodeDataMap(Mapping[str, UCD]):
+    """The records of a file structured like UnicodeData.txt, keyed by
+    code point.
+
+    The lines of the file are kept as they are and only parsed into a
+    record when the code point is looked up. The file also gives some
+    large blocks of code points, like the CJK ideographs, as a single
+    range rather than a line for each code point. Those ranges are kept
+    as ranges, and the record for a code point in them is only built
+    when it is looked up.
+
+    :param lines: The lines given individually in the file, keyed by
+        code point.
+    :param ranges: The ranges as the start, stop, and the record for
+        the start of the range. The stop is not in the range.
+    :param delim: (Optional.) The delimiter between the fields of the
+        lines. It defaults to a semicolon.
+    """
+    def __init__(
+        self,
+        lines: dict[str, str],
+        ranges: Sequence[tuple[int, int, UCD]],
+        delim: str = ';'
+    ) -> None:
+        self.__lines = lines
+        self.__ranges = ranges
+        self.__delim = delim
+        self.__records: dict[str, UCD] = {}
+        self.__starts = array('L', (start for start, _, _ in ranges))
+
+    def __getitem__(self, code: str) -> UCD:
+        if code in self.__records:
+            return self.__records[code]
+        if code in self.__lines:
+            ucd = parse_unicode_data(self.__lines[code], self.__delim)
+            self.__records[code] = ucd
+            return ucd
+
+        try:
+            n = int(code, 16)
+        except ValueError:
+            raise KeyError(code)
+        index = bisect(self.__starts, n) - 1
+        if index < 0 or n >= self.__ranges[index][1]:
+            raise KeyError(code)
+        start, _, first = self.__ranges[index]
+        code = f'{n:04X}'
+        name = first.na
+        if start in UCD_RANGES:
+            name = UCD_RANGES[start]
+            if name.startswith('HANGUL'):
+                name += build_hangul_name(code)
+            else:
+                name += code
+        return replace(first, code=code, na=name)
+
+    def __iter__(self) -> Iterator[str]:
+        ranges = iter(self.__ranges)
+        range_ = next(ranges, None)
+        for key in self.__lines:
+            n = int(key, 16)
+            while range_ and range_[0] < n:
+                yield from (util.to_code(i) for i in range(*range_[:2]))
+                range_ = next(ranges, None)
+            yield key
+        while range_:
+            yield from (util.to_code(i) for i in range(*range_[:2]))
+            range_ = next(ranges, None)
+
+    def __len__(self) -> int:
+        ranged = sum(stop - start for start, stop, _ in self.__ranges)
+        return len(self.__lines) + ranged
+
+    def find(self, field: str, test: Callable[[str], bool]) -> Iterator[int]:
+        """Find the code points with values in the given field that
+        pass the test, in order. The code points in a range only differ
+        from the start of the range in their code and name, so for the
+        other fields each range is only tested once.
+        """
+        def find_in_range(range_: tuple[int, int, UCD]) -> Iterator[int]:
+            start, stop, first = range_
+            if field in ('code', 'na'):
+                for n in range(start, stop):
+                    if test(getattr(self[util.to_code(n)], field)):
+                        yield n
+            elif test(getattr(first, field)):
+                yield from range(start, stop)
+
+        ranges = iter(self.__ranges)
+        range_ = next(ranges, None)
+        for key in self.__lines:
+            n = int(key, 16)
+            while range_ and range_[0] < n:
+                yield from find_in_range(range_)
+                range_ = next(ranges, None)
+            if test(getattr(self[key], field)):
+                yield n
+        while range_:
+            yield from find_in_range(range_)
+            range_ = next(ranges, None)
+
+
+class ValueAliasMap(Mapping[str, dict[str, ValueAlias]]):
+    """The aliases for the values of each property, keyed by the
+    casefolded property alias.
+
+    The lines for each property are only split into records the first
+    time that property is looked up, since most uses only need the
+    values of one or two properties.
+
+    :param groups: The lines of the data file grouped by property.
+    :param by_alias: (Optional.) Whether to key the values by their
+        alias rather than their long name. It defaults to false.
+    """
+    def __init__(
+        self,
+        groups: dict[str, list[str]],
+        by_alias: bool = False
+    ) -> None:
+        self.__groups = groups
+        self.__by_alias = by_alias
+        self.__values: dict[str, dict[str, ValueAlias]] = {}
+
+    def __getitem__(self, prop: str) -> dict[str, ValueAlias]:
+        if prop not in self.__values:
+            values = {}
+            for rec in split_fields(self.__groups[prop], ';'):
+                prop_, alias, long, *other = rec
+                va = ValueAlias(prop_, alias, long, tuple(other))
+                key = alias if self.__by_alias else long
+                values[key.casefold()] = va
+            self.__values[prop] = values
+        return self.__values[prop]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__groups)
+
+    def __len__(self) -> int:
+        return len(self.__groups)
+
+    def by_alias(self) -> 'ValueAliasMap':
+        """Get the same data keyed by the alias of each value.
+
+        :return: The aliases as a :class:`charex.db.ValueAliasMap`.
+        :rtype: charex.db.ValueAliasMap
+        """
+        return ValueAliasMap(self.__groups, by_alias=True)
+
+
+class ValueRangeMap(Mapping[str, str]):
+    """The values of a property for ranges of code points, keyed by
+    code point. Code points not in any of the ranges have the missing
+    value. The range for a code point is found with a binary search of
+    the starts of the ranges.
+
+    :param ranges: The ranges as the start, stop, and value. The stop
+        is not in the range.
+    :param missing: (Optional.) The value for code points not in any
+        of the ranges. It defaults to an empty string.
+    """
+    def __init__(
+        self,
+        ranges: Iterable[tuple[int, int, str]],
+        missing: str = ''
+    ) -> None:
+        ranges = sorted(ranges)
+        self.__starts = array('L', (start for start, _, _ in ranges))
+        self.__stops = array('L', (stop for _, stop, _ in ranges))
+        self.__values = tuple(value for _, _, value in ranges)
+        self.__missing = missing
+
+    def __contains__(self, code: object) -> bool:
+        try:
+            return self.__find(int(cast(str, code), 16)) >= 0
+        except (TypeError, ValueError):
+            return False
+
+    def __getitem__(self, code: str) -> str:
+        try:
+            index = self.__find(int(code, 16))
+        except ValueError:
+            raise KeyError(code)
+        if index < 0:
+            return self.__missing
+        return self.__values[index]
+
+    def __iter__(self) -> Iterator[str]:
+        for start, stop in zip(self.__starts, self.__stops):
+            for n in range(start, stop):
+                yield util.to_code(n)
+
+    def __len__(self) -> int:
+        return sum(self.__stops) - sum(self.__starts)
+
+    def __find(self, n: int) -> int:
+        index = bisect(self.__starts, n) - 1
+        if index >= 0 and n < self.__stops[index]:
+            return index
+        return -1
+
+
 # Common data types.
 Content = Sequence[str]
+Getter = Callable[[str, str, str], str]
 PathMap = dict[str, PathInfo]
 PropMap = dict[str, str]
 Record = tuple[str, ...]
@@ -233,7 +565,6 @@ T = TypeVar('T')
 BidiBrackets = defaultdict[str, BidiBracket]
 Casefolds = defaultdict[str, Casefold]
 Casefoldings = dict[str, Casefolds]
-DenormalMap = defaultdict[str, tuple[str, ...]]
 DenormalMaps = dict[str, DenormalMap]
 EmojiSources = defaultdict[str, EmojiSource]
 EntityMap = dict[str, tuple[Entity, ...]]
@@ -245,13 +576,13 @@ SingleValue = defaultdict[str, str]
 SingleValues = dict[str, SingleValue]
 SimpleList = set[str]
 SimpleLists = dict[str, SimpleList]
+RangeLists = dict[str, CodeRanges]
 SpecialCasing = defaultdict[str, SpecialCase]
 SpecialCasings = dict[str, SpecialCasing]
-UnicodeData = dict[str, UCD]
-ValueAliases = dict[str, dict[str, ValueAlias]]
 ValueRanges = tuple[ValueRange, ...]
 Variants = defaultdict[str, Variant]
-DerivedNormal = tuple[SingleValues, SimpleLists]
+ValueRangeMaps = dict[str, ValueRangeMap]
+DerivedNormal = tuple[ValueRangeMaps, RangeLists]
 DerivedNormals = dict[str, DerivedNormal]
 
 
@@ -280,41 +611,96 @@ def get_denormal_map_for_code(prop: str, code: str) -> Record:
     alias = alias_property(prop).casefold()
     key = cache.prop_map[alias]
     dmap = getattr(cache, key)
-    return dmap[code]
+
+    # Most characters don't have any denormalizations. Using get keeps
+    # those misses from adding empty entries to the map.
+    return dmap.get(code, ())
+
+
+def find_codes_by_value(
+    prop: str,
+    test: Callable[[str], bool]
+) -> Iterator[int] | None:
+    """Find the code points with values of a property that pass the
+    test. Properties stored in two-stage tables, UnicodeData files, or
+    ranges of code points are searched without checking every code
+    point. `None` is returned if the property can't be found.
+    """
+    try:
+        getter, key = get_getter_for_property(prop)
+    except (KeyError, ValueError):
+        return None
+
+    if getter is get_unicode_data_by_code:
+        unicode_data = getattr(cache, key)
+        return unicode_data.find(
+            prop, lambda value: test(alias_value(prop, value))
+        )
+
+    # Binary properties only have two values, so each only has to be
+    # tested once.
+    ranges = None
+    if getter is get_prop_list:
+        ranges = getattr(cache, key).get(prop)
+    elif getter is get_derived_normal:
+        single, simple = getattr(cache, key)
+        if prop not in single:
+            ranges = simple.get(prop)
+    if ranges is not None:
+        yes = test(alias_value(prop, 'Y'))
+        no = test(alias_value(prop, 'N'))
+        return ranges.find(yes, no)
+
+    if getter in (get_single_value_by_code, get_value_range_by_code):
+        table = cache.get_stage_table(key)
+        return table.find(lambda value: test(alias_value(prop, value)))
+
+    # Everything else has to check each code point, but the getter
+    # only has to be found once.
+    return scan_codes(prop, test, getter, key)
+
+
+def scan_codes(
+    prop: str,
+    test: Callable[[str], bool],
+    getter: Getter,
+    key: str
+) -> Iterator[int]:
+    """Check the value of a property for every code point, yielding
+    the code points with values that pass the test.
+    """
+    for n in range(util.LEN_UNICODE):
+        try:
+            value = getter(prop, util.to_code(n), key)
+        except KeyError:
+            continue
+        if test(alias_value(prop, value)):
+            yield n
 
 
 def get_value_for_code(prop: str, code: str) -> str:
     """Retrieve the value of a property for a character."""
+    getter, key = get_getter_for_property(prop)
+    value = getter(prop, code, key)
+    return alias_value(prop, value)
+
+
+@lru_cache(maxsize=256)
+def get_getter_for_property(prop: str) -> tuple[Getter, str]:
+    """Find the getter and the data file for a property. The answer
+    doesn't change, so it is cached rather than worked out again for
+    every code point.
+    """
     alias = alias_property(prop).casefold()
     key = cache.prop_map[alias]
     kind = cache.path_map[key].kind
-
-    by_kind = {
-        'bidi_brackets': get_defined_record_by_code,
-        'casefolding': get_casefolding,
-        'cjk_radicals': get_cjk_radical_by_code,
-        'derived_normal': get_derived_normal,
-        'emoji_source': get_defined_record_by_code,
-        'name_alias': get_name_alias_by_code,
-        'prop_list': get_prop_list,
-        'simple_list': get_simple_list_by_code,
-        'single_value': get_single_value_by_code,
-        'special_casing': get_defined_record_by_code,
-        'unicode_data': get_unicode_data_by_code,
-        'unihan': get_unihan_by_code,
-        'value_range': get_value_range_by_code,
-    }
-    try:
-        value = by_kind[kind](prop, code, key)
-    except KeyError as ex:
-        if kind == 'denormal_map':
-            msg = (
-                'denormal_map properties must be retrieved with '
-                'db.get_denormal_map_for_code.'
-            )
-            raise ValueError(msg)
-        raise ex
-    return alias_value(prop, value)
+    if kind == 'denormal_map':
+        msg = (
+            'denormal_map properties must be retrieved with '
+            'db.get_denormal_map_for_code.'
+        )
+        raise ValueError(msg)
+    return getters_by_kind[kind], key
 
 
 def get_cjk_radical_by_code(prop: str, code: str, key: str) -> str:
@@ -403,13 +789,8 @@ def get_single_value_by_code(prop: str, code: str, key: str) -> str:
     """Get the value of a property stored in a `single_value` file
     for the given code point.
     """
-    single_value = getattr(cache, key)
-    value = single_value[code]
-
-    if value == '<script>':
-        value = get_value_for_code('sc', code)
-
-    return value
+    table = cache.get_stage_table(key)
+    return table[int(code, 16)]
 
 
 def get_versions() -> tuple[str, ...]:
@@ -443,11 +824,26 @@ def get_value_range_by_code(prop: str, code: str, key: str) -> str:
     """Get the value of a property stored in a `value_range` file
     for the given code point.
     """
-    vrs = getattr(cache, key)
-    n = int(code, 16)
-    starts = tuple(vr.start for vr in vrs)
-    index = bisect(starts, n)
-    return vrs[index - 1].value
+    table = cache.get_stage_table(key)
+    return table[int(code, 16)]
+
+
+# The getters for each kind of data file, used by get_value_for_code.
+getters_by_kind = {
+    'bidi_brackets': get_defined_record_by_code,
+    'casefolding': get_casefolding,
+    'cjk_radicals': get_cjk_radical_by_code,
+    'derived_normal': get_derived_normal,
+    'emoji_source': get_defined_record_by_code,
+    'name_alias': get_name_alias_by_code,
+    'prop_list': get_prop_list,
+    'simple_list': get_simple_list_by_code,
+    'single_value': get_single_value_by_code,
+    'special_casing': get_defined_record_by_code,
+    'unicode_data': get_unicode_data_by_code,
+    'unihan': get_unihan_by_code,
+    'value_range': get_value_range_by_code,
+}
 
 
 # Query data not sorted by code.
@@ -535,8 +931,8 @@ def load_casefolding(info: PathInfo) -> Casefolds:
         data.setdefault(key, ['<code>' for _ in range(len(by_status))])
         data[key][index] = value
     cfs: Casefolds = defaultdict(Casefold)
-    for key in data:
-        cfs[key] = Casefold(*data[key])
+    for key, values in data.items():
+        cfs[key] = Casefold(*values)
     return cfs
 
 
@@ -553,17 +949,10 @@ def load_cjk_radicals(info: PathInfo) -> Radicals:
 
 def load_denormal_map(info: PathInfo) -> DenormalMap:
     """Load a data file with a denormalization map."""
-    lines = load_from_archive(info)
-    text = '\n'.join(line for line in lines)
-    json = loads(text)
-    dmap = defaultdict(tuple)
-    for key in json:
-        codes = ' '.join(util.to_code(s) for s in key)
-        dmap[codes] = tuple(json[key])
-    return dmap
+    return DenormalMap(loads(read_from_archive(info)))
 
 
-def load_derived_normal(info: PathInfo) -> tuple[SingleValues, SimpleLists]:
+def load_derived_normal(info: PathInfo) -> DerivedNormal:
     """Load a data file with derived normalization properties."""
     docs: list[list[str]] = []
     doc: list[str] = []
@@ -576,10 +965,10 @@ def load_derived_normal(info: PathInfo) -> tuple[SingleValues, SimpleLists]:
     else:
         docs.append(doc)
 
-    singles: SingleValues = {}
-    simples: SimpleLists = {}
+    singles: ValueRangeMaps = {}
+    simples: RangeLists = {}
     for doc in docs:
-        records, missing = parse(doc, True, info.delim)
+        records, missing = parse(doc, False, info.delim)
         missing = missing.split(';')[-1]
         if not records:
             continue
@@ -588,16 +977,15 @@ def load_derived_normal(info: PathInfo) -> tuple[SingleValues, SimpleLists]:
         prop = alias_property(prop).casefold()
         num_fields = len(records[0])
         if num_fields == 2:
-            for rec in records:
-                code, _ = rec
-                simples.setdefault(prop, set())
-                simples[prop].add(code)
+            code_ranges = (parse_code_range(rec[0]) for rec in records)
+            simples[prop] = CodeRanges(code_ranges)
 
         elif num_fields == 3:
-            for rec in records:
-                code, _, value = rec
-                singles.setdefault(prop, defaultdict(Default(missing)))
-                singles[prop][code.casefold()] = value
+            value_ranges = (
+                (*parse_code_range(code), value)
+                for code, _, value in records
+            )
+            singles[prop] = ValueRangeMap(value_ranges, missing)
 
         else:
             raise ValueError(f'{prop} has {num_fields} fields.')
@@ -619,14 +1007,14 @@ def load_entity_map(info: PathInfo) -> EntityMap:
     fh.close()
 
     emap: dict[str, list[Entity]] = dict()
-    for name in json:
-        codes = tuple(util.to_code(n) for n in json[name]['codepoints'])
-        chars = json[name]['characters']
+    for name, entity in json.items():
+        codes = tuple(util.to_code(n) for n in entity['codepoints'])
+        chars = entity['characters']
         for code in codes:
             key = code.casefold()
             emap.setdefault(key, list())
             emap[key].append(Entity(name, codes, chars))
-    return {key: tuple(emap[key]) for key in emap}
+    return {key: tuple(value) for key, value in emap.items()}
 
 
 def load_name_alias(info: PathInfo) -> NameAliases:
@@ -646,17 +1034,17 @@ def load_named_sequence(info: PathInfo) -> NamedSequences:
     return load_defined_record(info, NamedSequence)
 
 
-def load_prop_list(info: PathInfo) -> SimpleLists:
+def load_prop_list(info: PathInfo) -> RangeLists:
     """Load a data file with simple list for multiple properties."""
-    records, _ = parse(info, True)
-    data: SimpleLists = {}
+    records, _ = parse(info)
+    ranges: dict[str, list[tuple[int, int]]] = {}
     for rec in records:
         code, long, *_ = rec
         prop = alias_property(long)
         prop = prop.casefold()
-        data.setdefault(prop, set())
-        data[prop].add(code.casefold())
-    return data
+        ranges.setdefault(prop, list())
+        ranges[prop].append(parse_code_range(code))
+    return {prop: CodeRanges(ranges[prop]) for prop in ranges}
 
 
 def load_property_alias(info: PathInfo) -> PropertyAliases:
@@ -676,17 +1064,16 @@ def load_simple_list(info: PathInfo) -> SimpleList:
     return {rec[0].casefold() for rec in records}
 
 
-def load_single_value(info: PathInfo) -> SingleValue:
+def load_single_value(info: PathInfo) -> ValueRangeMap:
     """Load a data file that contains a simple mapping of code point
     to value.
     """
-    records, missing = parse(info, True)
-    data = defaultdict(Default(missing))
-    for rec in records:
-        code, value = rec
-        code = code.casefold()
-        data[code.strip()] = value.strip()
-    return data
+    records, missing = parse(info)
+    ranges = (
+        (*parse_code_range(code), intern(value))
+        for code, value in records
+    )
+    return ValueRangeMap(ranges, missing)
 
 
 def load_special_casing(info: PathInfo) -> SpecialCasing:
@@ -707,77 +1094,77 @@ def load_standardized_variant(info: PathInfo) -> Variants:
     return load_defined_record(info, Variant)
 
 
-def load_unicode_data(info: PathInfo) -> UnicodeData:
-    """Load data from a file that is structured like UnicodeData.txt."""
-    lines = load_from_archive(info)
-    lines = strip_comments(lines)
-    records = split_fields(lines, info.delim)
+def load_unicode_data(info: PathInfo) -> UnicodeDataMap:
+    """Load data from a file that is structured like UnicodeData.txt.
+    Only the lines that start ranges are parsed here, the rest wait
+    until their code point is looked up.
+    """
     data = {}
-    for i, rec in enumerate(records):
-        code, name, *other = rec
-        if not name.endswith('First>'):
-            key = code.casefold()
-            data[key] = UCD(code.upper(), name, *other)
-        elif name.endswith('Last>'):
-            pass
+    ranges = []
+    first = None
+    for line in load_from_archive(info):
+        line = line.partition('#')[0]
+        if not line:
+            continue
+        code, name, _ = line.split(info.delim, 2)
+
+        # The line closing a range is kept as its own line, so the
+        # range stops before it.
+        if first is not None:
+            ranges.append((int(first.code, 16), int(code, 16), first))
+            first = None
+        if name.endswith('First>'):
+            first = parse_unicode_data(line, info.delim)
         else:
-            start = int(code, 16)
-            stop = int(records[i + 1][0], 16) + 1
-            for n in range(start, stop):
-                code = util.to_code(n).upper()
-                key = code.casefold()
-                if start in UCD_RANGES:
-                    name = UCD_RANGES[start]
-                    if name.startswith('HANGUL'):
-                        name += build_hangul_name(code)
-                    else:
-                        name += code
-                data[key] = UCD(code, name, *other)
-    return data
+            data[code.strip().casefold()] = line
+    return UnicodeDataMap(data, ranges, info.delim)
 
 
-def load_value_aliases(info: PathInfo) -> ValueAliases:
+def load_value_aliases(info: PathInfo) -> ValueAliasMap:
     """Load a data file that contains information about property
-    value aliases.
+    value aliases. The lines are only grouped by property here, the
+    rest of the parsing waits until a property is used.
     """
-    lines = load_from_archive(info)
-    lines = strip_comments(lines)
-    records = split_fields(lines, info.delim)
-    data: ValueAliases = {}
-    for rec in records:
-        prop, alias, long, *other = rec
-        va = ValueAlias(prop, alias, long, tuple(other))
-        prop = prop.casefold()
-        long = long.casefold()
-        data.setdefault(prop, dict())
-        data[prop][long] = va
-    return data
+    groups: dict[str, list[str]] = {}
+    for line in load_from_archive(info):
+        line = line.partition('#')[0]
+        if not line:
+            continue
+        prop = line.split(info.delim, 1)[0].strip().casefold()
+        groups.setdefault(prop, []).append(line)
+    return ValueAliasMap(groups)
 
 
 def load_unihan(info: PathInfo) -> SingleValues:
     """Load data from a file of Unihan properties."""
     records, missing = parse(info)
+
+    # The files have over a million records but only a few dozen
+    # properties, so each property is only aliased once.
     data: SingleValues = dict()
-    for rec in records:
-        code, prop, value = rec
-        code = code[2:]
-        code = code.casefold()
-        prop = alias_property(prop.strip())
-        prop = prop.casefold()
-        data.setdefault(prop, defaultdict(Default(missing)))
-        data[prop][code.strip()] = value.strip()
+    props: dict[str, SingleValue] = dict()
+    for code, prop, value in records:
+        if prop not in props:
+            alias = alias_property(prop).casefold()
+            props[prop] = data.setdefault(
+                alias, defaultdict(Default(missing))
+            )
+        props[prop][code[2:].casefold()] = value
     return data
 
 
 def load_value_range(info: PathInfo) -> ValueRanges:
-    """Load a data file that contains a list of Unicode ranges."""
+    """Load a data file that contains a list of Unicode ranges. The
+    ranges don't have to be in order, and a range can be a single code
+    point. Any gaps between the ranges get the file's missing value.
+    """
     records, missing = parse(info)
+    ranges = sorted(
+        (*parse_code_range(range_), value) for range_, value in records
+    )
     data = []
     last_stop = 0x0000
-    for rec in records:
-        range_, value = rec
-        start, stop = [int(n, 16) for n in range_.split('..')]
-        stop += 1
+    for start, stop, value in ranges:
         if last_stop != start:
             data.append(ValueRange(last_stop, start, missing))
         data.append(ValueRange(start, stop, value))
@@ -819,13 +1206,87 @@ def load_prop_map() -> PropMap:
 
 def load_from_archive(info: PathInfo, codec: str = 'utf8') -> Content:
     """Read data from a zip archive."""
+    text = read_from_archive(info).decode(codec)
+
+    # Split on newlines only, the way reading the lines of the file
+    # would. str.splitlines also breaks on characters like U+2028.
+    lines = text.split('\n')
+    if lines and not lines[-1]:
+        lines.pop()
+    return tuple(line.rstrip() for line in lines)
+
+
+def read_from_archive(info: PathInfo) -> bytes:
+    """Read the raw contents of a file in a zip archive."""
     path = PKG_DATA / info.archive
     with as_file(path) as sh:
         with ZipFile(sh) as zh:
-            with zh.open(info.path) as zch:
-                blines = zch.readlines()
-    lines = [bline.decode(codec) for bline in blines]
-    return tuple(line.rstrip() for line in lines)
+            return zh.read(info.path)
+
+
+# Lookup table construction.
+def build_stage_table(vrs: ValueRanges) -> StageTable:
+    """Build a two-stage lookup table from value ranges that cover
+    all of Unicode.
+    """
+    values = tuple(dict.fromkeys(vr.value for vr in vrs))
+    indexes = {value: i for i, value in enumerate(values)}
+    points = array('H')
+    for vr in vrs:
+        points.extend(array('H', [indexes[vr.value]]) * (vr.stop - vr.start))
+
+    blocks: dict[bytes, int] = {}
+    stage1 = array('L')
+    stage2 = array('H')
+    for start in range(0, len(points), STAGE_SIZE):
+        block = points[start:start + STAGE_SIZE]
+        bkey = block.tobytes()
+        if bkey not in blocks:
+            blocks[bkey] = len(stage2)
+            stage2.extend(block)
+        stage1.append(blocks[bkey])
+    return StageTable(stage1, stage2, values)
+
+
+def fill_stage_table(
+    table: StageTable,
+    placeholder: str,
+    other: StageTable
+) -> StageTable:
+    """Build a two-stage lookup table where the code points with the
+    placeholder value take their value from another table instead.
+    Each pair of blocks from the two tables is only merged once.
+    """
+    values = tuple(dict.fromkeys(
+        value for value in (*table.values, *other.values)
+        if value != placeholder
+    ))
+    indexes = {value: i for i, value in enumerate(values)}
+    own = [indexes.get(value, 0) for value in table.values]
+    theirs = [indexes[value] for value in other.values]
+    hole = table.values.index(placeholder)
+
+    merged: dict[tuple[int, int], int] = {}
+    blocks: dict[bytes, int] = {}
+    stage1 = array('L')
+    stage2 = array('H')
+    for pair in zip(table.stage1, other.stage1):
+        if pair not in merged:
+            a, b = pair
+            block = array('H', (
+                theirs[j] if i == hole else own[i]
+                for i, j in zip(
+                    table.stage2[a:a + STAGE_SIZE],
+                    other.stage2[b:b + STAGE_SIZE]
+                )
+            ))
+            bkey = block.tobytes()
+            if bkey not in blocks:
+                blocks[bkey] = len(stage2)
+                stage2.extend(block)
+            merged[pair] = blocks[bkey]
+        stage1.append(merged[pair])
+    return StageTable(stage1, stage2, values)
 
 
 # Data cross-referencing utilities.
@@ -873,28 +1334,47 @@ def parse(
         lines = file
         delim = delim_
 
+    # Missing values, comments, and fields are all handled in one
+    # pass over the lines, since some of the files are large.
     missing = ''
-    missing_vrs = parse_missing(lines)
-    if missing_vrs:
-        missing = missing_vrs[0].value
-
-    lines = strip_comments(lines)
-    records = split_fields(lines, delim, split)
-    return records, missing
+    found_missing = False
+    records: list[Record] = []
+    for line in lines:
+        data = line.partition('#')[0]
+        if not data:
+            if not found_missing and line.startswith('# @missing: '):
+                _, value, *other = map(str.strip, line[12:].split(';'))
+                missing = ';'.join((value, *other))
+                found_missing = True
+            continue
+        rec = tuple(map(str.strip, data.split(delim)))
+        if split and '..' in rec[0]:
+            records.extend(split_range(rec))
+        else:
+            records.append(rec)
+    return tuple(records), missing
 
 
-def parse_missing(lines: Content) -> ValueRanges:
-    """Parse Unicode missing values from data files."""
-    data = []
-    lines = [line[12:] for line in lines if line.startswith('# @missing: ')]
-    records = split_fields(lines, ';', False)
-    for rec in records:
-        range_, value, *other = rec
-        start, stop = [int(n, 16) for n in range_.split('..')]
-        stop += 1
-        value = ';'.join((value, *other))
-        data.append(ValueRange(start, stop, value))
-    return tuple(data)
+def parse_unicode_data(line: str, delim: str = ';') -> UCD:
+    """Parse a line from a file structured like UnicodeData.txt. The
+    fields that only have a few possible values are interned, so the
+    records share the strings.
+    """
+    fields = map(str.strip, line.split(delim))
+    code, na, gc, ccc, bc, dt, decimal, digit, nv, bidi_m, *other = fields
+    return UCD(
+        code.upper(),
+        na,
+        intern(gc),
+        intern(ccc),
+        intern(bc),
+        dt,
+        intern(decimal),
+        intern(digit),
+        intern(nv),
+        intern(bidi_m),
+        *other
+    )
 
 
 def split_fields(
@@ -915,6 +1395,16 @@ def split_fields(
     return tuple(records)
 
 
+def parse_code_range(range_: str) -> tuple[int, int]:
+    """Parse a code point or range of code points from a data file
+    into the start and stop of the range.
+    """
+    start, _, last = range_.partition('..')
+    if not last:
+        last = start
+    return int(start, 16), int(last, 16) + 1
+
+
 def split_range(rec: Record) -> Generator[Record, None, None]:
     """Split a unicode range into individual records."""
     values, *other = rec
@@ -927,12 +1417,6 @@ def split_range(rec: Record) -> Generator[Record, None, None]:
         yield (util.to_code(n), *other)
 
 
-def strip_comments(lines: Content) -> Content:
-    """Remove comments and blank lines from a file."""
-    lines = [line.split('#', 1)[0] for line in lines]
-    return tuple(line for line in lines if line)
-
-
 # Unicode defined algorithms.
 def decompose_hangul(s: int) -> tuple[int, int, int]:
     """Given the :class:`int` for a Unicode Hangul code point, return
@@ -995,15 +1479,16 @@ class FileCache:
         self.__named_sequence: NamedSequences = defaultdict(NamedSequence)
         self.__property_alias: PropertyAliases = dict()
         self.__property_name: PropertyAliases = dict()
-        self.__prop_list: dict[str, SimpleLists] = dict()
+        self.__prop_list: dict[str, RangeLists] = dict()
         self.__simple_list: SimpleLists = dict()
-        self.__single_value: SingleValues = dict()
+        self.__single_value: ValueRangeMaps = dict()
+        self.__stage_tables: dict[str, StageTable] = dict()
         self.__specialcasings: SpecialCasings = dict()
         self.__standardized_variant: Variants = defaultdict(Variant)
-        self.__unicode_data: UnicodeData = dict()
+        self.__unicode_data: dict[str, UnicodeDataMap] = dict()
         self.__unihan: dict[str, SingleValues] = dict()
-        self.__value_aliases: ValueAliases = dict()
-        self.__value_names: ValueAliases = dict()
+        self.__value_aliases: ValueAliasMap | None = None
+        self.__value_names: ValueAliasMap | None = None
         self.__value_range: dict[str, ValueRanges] = dict()
         self.__versions: dict[str, Version] = dict()
 
@@ -1016,7 +1501,7 @@ class FileCache:
             'unicode_data': Kind(
                 load_unicode_data,
                 self.__unicode_data,
-                'update'
+                'store'
             ),
             'prop_list': Kind(
                 load_prop_list,
@@ -1108,25 +1593,55 @@ class FileCache:
                 if not kind.cache:
                     loaded: dict = kind.load(pi)
                     kind.cache.update(loaded)
-                return kind.cache
+                value = kind.cache
 
             elif kind.action == 'store':
                 if name not in kind.cache:
                     loaded = kind.load(pi)
                     kind.cache[name] = loaded
-                return kind.cache[name]
-            
+                value = kind.cache[name]
+
             elif kind.action == 'load':
                 if not kind.cache:
                     loaded = kind.load(pi)
                     kind.cache = loaded
-                return kind.cache
+                value = kind.cache
 
         except KeyError:
             if name not in self.path_map:
                 raise AttributeError(f'Not in path_map: {name}.')
             raise AttributeError(name)
 
+        # Keep the loaded data as an attribute, so later lookups find
+        # it directly instead of coming back through here.
+        setattr(self, name, value)
+        return value
+
+    def get_stage_table(self, name: str) -> StageTable:
+        """Get the two-stage lookup table for a `value_range` or
+        `single_value` file.
+        """
+        if name not in self.__stage_tables:
+            # The table holds everything the ranges do, so only use
+            # ranges that are already loaded rather than caching them
+            # a second time.
+            vrs = self.__value_range.get(name)
+            if vrs is None:
+                vrs = load_value_range(self.path_map[name])
+            table = build_stage_table(vrs)
+
+            # Some files, like ScriptExtensions.txt, default to the
+            # script of the code point. Fill those in from the script
+            # table once here rather than on every lookup.
+            if '<script>' in table.values:
+                _, key = get_getter_for_property('sc')
+                scripts = self.get_stage_table(key)
+                values = tuple(alias_value('sc', v) for v in scripts.values)
+                scripts = replace(scripts, values=values)
+                table = fill_stage_table(table, '<script>', scripts)
+            self.__stage_tables[name] = table
+        return self.__stage_tables[name]
+
     @property
     def entity_map(self) -> EntityMap:
         if not self.__entity_map:
@@ -1173,26 +1688,16 @@ class FileCache:
         return self.__property_name
 
     @property
-    def value_aliases(self) -> ValueAliases:
-        if not self.__value_aliases:
+    def value_aliases(self) -> ValueAliasMap:
+        if self.__value_aliases is None:
             info = self.path_map[PATH_VALUE_ALIASES]
-            data = load_value_aliases(info)
-            self.__value_aliases.update(data)
+            self.__value_aliases = load_value_aliases(info)
         return self.__value_aliases
 
     @property
-    def value_name(self) -> ValueAliases:
-        if not self.__value_names:
-            vmap = self.value_aliases
-            data: ValueAliases = dict()
-            for prop in vmap:
-                pvmap = vmap[prop]
-                data.setdefault(prop, dict())
-                data[prop] = {
-                    pvmap[key].alias.casefold(): pvmap[key]
-                    for key in pvmap
-                }
-            self.__value_names.update(data)
+    def value_name(self) -> ValueAliasMap:
+        if self.__value_names is None:
+            self.__value_names = self.value_aliases.by_alias()
         return self.__value_names
 
 
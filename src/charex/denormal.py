@@ -4,11 +4,11 @@ denormal
 
 Functions for reversing normalization of string.
 """
-from collections.abc import Generator, Sequence
+from collections.abc import Generator
 from math import prod
 from random import choice, seed
 
-from charex.charex import Character
+from charex.charex import get_character
 
 
 # Functions.
@@ -39,7 +39,7 @@ def count_denormalizations(
         8
 
     """
-    chars = (Character(c) for c in base)
+    chars = (get_character(c) for c in base)
     counts = []
     for char in chars:
         count = len(char.denormalize(form))
@@ -105,7 +105,7 @@ def denormalize(
         return random_denormalize(base, form, maxresults, seed_)
 
     # Get the denormalized forms of the first character.
-    char = Character(base[0])
+    char = get_character(base[0])
     dechars = list(char.denormalize(form))
 
     # If there are no denormalized forms, then it is the denormalized form.
@@ -182,7 +182,7 @@ def gen_denormalize(
 
     """
     c, rest = base[0], base[1:]
-    char = Character(c)
+    char = get_character(c)
     dechars = char.denormalize(form)
     if not dechars:
         dechars = (char.value,)
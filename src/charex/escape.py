@@ -5,7 +5,6 @@ escape
 Character escape schemes.
 """
 from collections.abc import Callable
-from json import loads
 
 from charex.db import cache
 from charex import util
@@ -152,12 +151,8 @@ def unicode_utf16_escape(char: str) -> str:
         return unicode_2_byte_escape(char)
     except EscapeError:
         b = char.encode('utf_16_be')
-        result = ''
-        for i in range(0, len(b), 2):
-            result += '\\u'
-            result += f'{b[i]:02x}'
-            result += f'{b[i + 1]:02x}'
-        return result
+        units = b.hex(' ', 2).split()
+        return ''.join(f'\\u{unit}' for unit in units)
 
 
 # Escape schemes.
@@ -606,8 +601,9 @@ def escape_url(char: str, codec: str) -> str:
     :rtype: str
     """
     b = char.encode(codec)
-    octets = [f'%{x:02x}'.upper() for x in b]
-    return ''.join(x for x in octets)
+    if not b:
+        return ''
+    return '%' + b.hex('%').upper()
 
 
 # Bulk escape.
@@ -622,5 +618,8 @@ def escape(s: str, schemekey: str, codec: str = 'utf8') -> str:
     :return: The escaped :class:`str`.
     :rtype: str
     """
+    # Text tends to repeat the same characters, so each distinct
+    # character is only escaped once.
     scheme = schemes[schemekey]
-    return ''.join(scheme(char, codec) for char in s)
+    escaped = {char: scheme(char, codec) for char in set(s)}
+    return ''.join([escaped[char] for char in s])
@@ -89,7 +89,7 @@ def quote():
     if 'charset' in request.args:
         codec = request.args['charset']
     lines = charex.read_resource('quote', codec=codec)
-    doc = ''.join(line for line in lines)
+    doc = ''.join(lines)
     resp = make_response(doc)
     return resp
 
@@ -7,7 +7,6 @@ from collections.abc import Sequence
 from dataclasses import asdict, dataclass
 from json import dump, load
 from pathlib import Path
-from typing import TypeVar
 
 
 # Utility data.
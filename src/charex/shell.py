@@ -4,7 +4,7 @@ shell
 
 An interactive command shell for :mod:`charex`.
 """
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable
 from argparse import (
     ArgumentParser,
     Namespace,
@@ -12,15 +12,15 @@ from argparse import (
     RawDescriptionHelpFormatter
 )
 from cmd import Cmd
+from functools import lru_cache
 import readline
 from shlex import split
 from shutil import get_terminal_size
+import sys
 from textwrap import wrap
 
 from charex import cmds
-from charex import charsets as cset
 from charex import escape as esc
-from charex import gui
 from charex import normal as nl
 from charex import util
 
@@ -51,9 +51,7 @@ def mode_cd(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.cd(args.base):
-        print(line)
-    print()
+    write_lines(cmds.cd(args.base))
 
 
 def mode_ce(args: Namespace) -> None:
@@ -63,9 +61,7 @@ def mode_ce(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.ce(args.base):
-        print(line)
-    print()
+    write_lines(cmds.ce(args.base))
 
 
 def mode_cl(args: Namespace) -> None:
@@ -75,11 +71,7 @@ def mode_cl(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.cl(args.description):
-        print(line)
-        if args.description:
-            print()
-    print()
+    write_lines(cmds.cl(args.description), args.description)
 
 
 def mode_clear(args: Namespace) -> None:
@@ -124,15 +116,13 @@ def mode_dn(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for result in cmds.dn(
+    write_lines(cmds.dn(
         args.base,
         args.form,
         args.maxdepth,
         args.random,
         args.seed
-    ):
-        print(result)
-    print()
+    ))
 
 
 def mode_dt(args: Namespace) -> None:
@@ -142,10 +132,9 @@ def mode_dt(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.dt(args.codepoint):
-        bline = line.encode('utf_8', errors='replace')
-        print(bline.decode('utf_8'))
-    print()
+    text = '\n'.join(cmds.dt(args.codepoint)) + '\n\n'
+    btext = text.encode('utf_8', errors='replace')
+    sys.stdout.write(btext.decode('utf_8'))
 
 
 def mode_el(args: Namespace) -> None:
@@ -155,11 +144,7 @@ def mode_el(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.el(args.description):
-        print(line)
-        if args.description:
-            print()
-    print()
+    write_lines(cmds.el(args.description), args.description)
 
 
 def mode_es(args: Namespace) -> None:
@@ -181,11 +166,7 @@ def mode_fl(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.fl(args.description):
-        print(line)
-        if args.description:
-            print()
-    print()
+    write_lines(cmds.fl(args.description), args.description)
 
 
 def mode_gui(args: Namespace) -> None:
@@ -195,6 +176,9 @@ def mode_gui(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
+    # The GUI pulls in tkinter, so only import it when it's used.
+    from charex import gui
+
     print('Running charex GUI....')
     gui.main()
     print('charex GUI stopped.')
@@ -219,9 +203,7 @@ def mode_ns(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.ns():
-        print(line)
-    print()
+    write_lines(cmds.ns())
 
 
 def mode_pf(args: Namespace) -> None:
@@ -259,9 +241,7 @@ def mode_sv(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.sv():
-        print(line)
-    print()
+    write_lines(cmds.sv())
 
 
 def mode_up(args: Namespace) -> None:
@@ -271,11 +251,7 @@ def mode_up(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.up(args.description):
-        print(line)
-        if args.description:
-            print()
-    print()
+    write_lines(cmds.up(args.description), args.description)
 
 
 def mode_uv(args: Namespace) -> None:
@@ -285,11 +261,7 @@ def mode_uv(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.uv(args.prop, args.description):
-        print(line)
-        if args.description:
-            print()
-    print()
+    write_lines(cmds.uv(args.prop, args.description), args.description)
 
 
 def mode_vn(args: Namespace) -> None:
@@ -299,15 +271,18 @@ def mode_vn(args: Namespace) -> None:
     :return: None.
     :rtype: NoneType
     """
-    for line in cmds.vn():
-        print(line)
-    print()
+    write_lines(cmds.vn())
 
 
 # Command parsing.
-def build_parser() -> ArgumentParser:
-    """Build the argument parser.
-
+@lru_cache(maxsize=8)
+def build_parser(mode: str | None = None) -> ArgumentParser:
+    """Build the argument parser. Parsers are cached, so each shell
+    and invocation shares the same parser.
+
+    :param mode: (Optional.) The name of the mode being invoked. If
+        given, only the subparser for that mode is built. If it isn't
+        given or isn't the name of a mode, all subparsers are built.
     :return: The :class:`argparse.ArgumentParser`.
     :rtype: argparse.ArgumentParser
     """
@@ -325,7 +300,10 @@ def build_parser() -> ArgumentParser:
         metavar='mode',
         required=True
     )
-    for fn in subparsers:
+    fns = [fn for fn in subparsers if fn.__name__ == f'parse_{mode}']
+    if not fns:
+        fns = subparsers
+    for fn in fns:
         fn(spa)
 
     return p
@@ -865,13 +843,11 @@ def invoke(
     """Parse the arguments used to invoke the script and execute
     the script.
     """
+    argv = split(cmd) if cmd else sys.argv[1:]
     if not p:
-        p = build_parser()
-    if cmd:
-        argv = split(cmd)
-        args = p.parse_args(argv)
-    else:
-        args = p.parse_args()
+        mode = argv[0] if argv else None
+        p = build_parser(mode)
+    args = p.parse_args(argv)
     args.func(args)
 
 
@@ -1130,13 +1106,13 @@ def describe_modes() -> str:
         'The following are brief desciptions of each of the '
         'available options for the mode:'
     ), width)
-    result = '\n'.join(text) + '\n\n'
-    for mode in modes:
+    lines = ['\n'.join(text) + '\n\n',]
+    for mode, fn in modes.items():
         name = mode.split('_')[1]
-        doc = modes[mode].__doc__
+        doc = fn.__doc__
         descr = doc.split('\n\n')[0]
-        result += f'  * {name}: {descr}\n'
-    return result
+        lines.append(f'  * {name}: {descr}\n')
+    return ''.join(lines)
 
 
 def list_modes() -> str:
@@ -1146,3 +1122,20 @@ def list_modes() -> str:
     names = ', '.join(mode.split('_')[1] for mode in modes)
     result += names
     return result
+
+
+def write_lines(lines: Iterable[str], spaced: bool = False) -> None:
+    """Write the lines of output from a mode followed by a blank line.
+    The lines are streamed rather than joined first, since modes like
+    dn can yield millions of them. The buffering of stdout still keeps
+    the writes to the terminal batched.
+
+    :param lines: The lines to write.
+    :param spaced: (Optional.) Whether to put a blank line after each
+        line. It defaults to false.
+    :return: None.
+    :rtype: NoneType
+    """
+    end = '\n\n' if spaced else '\n'
+    sys.stdout.writelines(f'{line}{end}' for line in lines)
+    sys.stdout.write('\n')
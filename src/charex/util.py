@@ -4,7 +4,7 @@ util
 
 Utility functions for :mod:`charex`.
 """
-from importlib.resources import as_file, files
+from importlib.resources import files
 from math import log
 import unicodedata as ucd
 
@@ -43,6 +43,11 @@ The following formats are available for use through the API:
 *   Bytes: A :class:`bytes` that decodes to a valid UTF-8 character.
 *   Integer: An :class:`int` within the range 0x00 <= x <= 0x10FFFF.
 '''
+CONTROL_CHARACTERS = {
+    n: n + 0x2400
+    for n in (*range(0x00, 0x20), *range(0x7f, 0xa0))
+    if ucd.category(chr(n)) == 'Cc'
+}
 DATA_LOC = 'charex.data'
 LEN_UNICODE = 0x110000
 RESOURCES = {
@@ -77,13 +82,10 @@ def bin2bytes(value: str, endian: str = 'big') -> bytes:
     """
     value = pad_byte(value, endian, base=2)
 
-    parts = []
-    while value:
-        parts.append(value[:8])
-        value = value[8:]
-    nums = [int(s, 2) for s in parts]
-    octets = [n.to_bytes((n.bit_length() + 7) // 8) for n in nums]
-    return b''.join(octets)
+    # Each octet is parsed by int on its own. Octets that are zero are
+    # dropped from the result.
+    nums = [int(value[i:i + 8], 2) for i in range(0, len(value), 8)]
+    return b''.join(n.to_bytes((n.bit_length() + 7) // 8) for n in nums)
 
 
 def get_description_from_docstring(obj: object) -> str:
@@ -118,14 +120,10 @@ def hex2bytes(value: str, endian: str = 'big') -> bytes:
     # odd length.
     value = pad_byte(value, endian)
 
-    # Convert the string to bytes.
-    parts = []
-    while value:
-        parts.append(value[:2])
-        value = value[2:]
-    nums = [int(s, 16) for s in parts]
-    octets = [n.to_bytes((n.bit_length() + 7) // 8) for n in nums]
-    return b''.join(octets)
+    # Convert the string to bytes. Each octet is parsed by int on its
+    # own. Octets that are zero are dropped from the result.
+    nums = [int(value[i:i + 2], 16) for i in range(0, len(value), 2)]
+    return b''.join(n.to_bytes((n.bit_length() + 7) // 8) for n in nums)
 
 
 def neutralize_control_characters(value: str) -> str:
@@ -136,18 +134,7 @@ def neutralize_control_characters(value: str) -> str:
     :return: The neutralized :class:`str`.
     :rtype: str
     """
-    def neutralize(char: str) -> str:
-        try:
-            if ucd.category(char) == 'Cc':
-                num = ord(char)
-                new = chr(num + 0x2400)
-                return new
-            return char
-        except TypeError as ex:
-            print(char)
-            raise ex
-
-    return ''.join(neutralize(char) for char in value)
+    return value.translate(CONTROL_CHARACTERS)
 
 
 def pad_byte(value: str, endian: str = 'big', base: int = 16) -> str:
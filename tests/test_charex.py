@@ -61,6 +61,29 @@ def test_character_core_properties():
     assert char.stc == '0041'
 
 
+def test_character_ascii_properties():
+    """The values of properties :class:`charex.Character` gives for
+    ASCII characters without loading the Unicode database should match
+    the values in the database.
+    """
+    for n in range(0x80):
+        char = c.Character(n)
+        code = f'{n:04x}'
+        for prop in c.ASCII_PROPS:
+            assert getattr(char, prop) == c.db.get_value_for_code(prop, code)
+
+
+def test_character_properties_are_stored(mocker):
+    """Once a property of a :class:`charex.Character` has been looked
+    up, later reads of the property should not query the database.
+    """
+    char = c.Character('a')
+    assert char.na == 'LATIN SMALL LETTER A'
+    spy = mocker.spy(c.db, 'get_value_for_code')
+    assert char.na == 'LATIN SMALL LETTER A'
+    assert spy.call_count == 0
+
+
 def test_character_derived_normalization_properties():
     """A :class:`charex.Character` should have the properties from
     DerivedNormalizationProperties.txt.
@@ -97,6 +120,13 @@ def test_character_derived_normalization_properties():
     char = c.Character('U+0344')
     assert char.comp_ex == 'Y'
 
+    # Simple list properties given for a single code point rather
+    # than a range.
+    assert c.Character('\u00a0').cwkcf == 'Y'
+    assert c.Character('\u00a8').xo_nfkd == 'Y'
+    assert c.Character('\u00a8').xo_nfkc == 'Y'
+    assert c.Character('\u0c48').xo_nfd == 'Y'
+
 
 def test_character_dictlike_properties():
     """A :class:`charex.Character` should have the properties from the
@@ -624,6 +654,18 @@ def test_character_summarize():
 
 
 # Test utility functions.
+def test_filter_by_property_table():
+    """When searching all of Unicode for a property stored in a lookup
+    table, :func:`filter_by_property` should yield the characters
+    with the value in code point order.
+    """
+    chars = list(c.filter_by_property('hst', 'lv', insensitive=True))
+    assert len(chars) == 399
+    assert chars[0].value == '\uac00'
+    assert chars[1].value == '\uac1c'
+    assert all(char.hst == 'LV' for char in chars)
+
+
 def test_validate_normalization_form_valid():
     """Given a :class:`str` that is a valid normalization form,
     :func:`validate_normalization_form` should return that form.
@@ -42,6 +42,71 @@ def test_build_hangul_name():
     assert db.build_hangul_name('d4db') == 'PWILH'
 
 
+# Test build_stage_table.
+def test_build_stage_table():
+    """When given value ranges that cover all of Unicode,
+    :func:`charex.db.build_stage_table` should return a
+    :class:`charex.db.StageTable` that gives the value for each
+    code point.
+    """
+    vrs = (
+        db.ValueRange(0x0000, 0x0080, 'spam'),
+        db.ValueRange(0x0080, 0x0300, 'eggs'),
+        db.ValueRange(0x0300, 0x110000, 'spam'),
+    )
+    table = db.build_stage_table(vrs)
+    assert table.values == ('spam', 'eggs')
+    assert table[0x0000] == 'spam'
+    assert table[0x007f] == 'spam'
+    assert table[0x0080] == 'eggs'
+    assert table[0x02ff] == 'eggs'
+    assert table[0x0300] == 'spam'
+    assert table[0x10ffff] == 'spam'
+
+
+def test_stage_table_find():
+    """When given a test, :meth:`charex.db.StageTable.find` should
+    yield the code points with values that pass the test, in order.
+    """
+    vrs = (
+        db.ValueRange(0x0000, 0x0041, 'spam'),
+        db.ValueRange(0x0041, 0x0043, 'eggs'),
+        db.ValueRange(0x0043, 0x10fffe, 'spam'),
+        db.ValueRange(0x10fffe, 0x110000, 'eggs'),
+    )
+    table = db.build_stage_table(vrs)
+    found = table.find(lambda value: value == 'eggs')
+    assert list(found) == [0x0041, 0x0042, 0x10fffe, 0x10ffff]
+    assert list(table.find(lambda value: value == 'bacon')) == []
+
+
+def test_fill_stage_table():
+    """When given a table, a placeholder, and another table,
+    :func:`charex.db.fill_stage_table` should return a table where
+    the code points with the placeholder value have the value from
+    the other table.
+    """
+    table = db.build_stage_table((
+        db.ValueRange(0x0000, 0x0041, '<script>'),
+        db.ValueRange(0x0041, 0x0043, 'eggs'),
+        db.ValueRange(0x0043, 0x110000, '<script>'),
+    ))
+    other = db.build_stage_table((
+        db.ValueRange(0x0000, 0x0042, 'spam'),
+        db.ValueRange(0x0042, 0x0300, 'bacon'),
+        db.ValueRange(0x0300, 0x110000, 'spam'),
+    ))
+    filled = db.fill_stage_table(table, '<script>', other)
+    assert '<script>' not in filled.values
+    assert filled[0x0040] == 'spam'
+    assert filled[0x0041] == 'eggs'
+    assert filled[0x0042] == 'eggs'
+    assert filled[0x0043] == 'bacon'
+    assert filled[0x02ff] == 'bacon'
+    assert filled[0x0300] == 'spam'
+    assert filled[0x10ffff] == 'spam'
+
+
 # Test cache.
 def test_cache():
     """When called, an attribute of :class:`FileCache` should return
@@ -57,6 +122,63 @@ def test_cache():
     assert db.cache.versions['1.0.0'].version == (1, 0, 0)
 
 
+def test_cache_keeps_loaded_data():
+    """Once loaded, the data for a file should be kept as an attribute
+    of the :class:`FileCache`.
+    """
+    data = db.cache.proplist
+    assert vars(db.cache)['proplist'] is data
+
+
+def test_cache_stage_table_only():
+    """Building the stage table for a `value_range` file shouldn't
+    also keep the ranges it was built from.
+    """
+    cache = db.FileCache()
+    table = cache.get_stage_table('blocks')
+    assert table[0x0041] == 'Basic Latin'
+    assert 'blocks' not in vars(cache)
+
+
+# Test CodeRanges.
+def test_code_ranges():
+    """A :class:`charex.db.CodeRanges` should contain the code points
+    within its ranges, and no others.
+    """
+    ranges = db.CodeRanges([(0x0041, 0x0043), (0x0061, 0x0062)])
+    assert '0040' not in ranges
+    assert '0041' in ranges
+    assert '0042' in ranges
+    assert '0043' not in ranges
+    assert '0061' in ranges
+    assert '10ffff' not in ranges
+    assert 'spam' not in ranges
+    assert list(ranges) == ['0041', '0042', '0061']
+    assert len(ranges) == 3
+
+
+def test_code_ranges_overlap():
+    """A :class:`charex.db.CodeRanges` should merge ranges that overlap
+    or touch.
+    """
+    ranges = db.CodeRanges([(0x0045, 0x0050), (0x0041, 0x0048)])
+    assert '0041' in ranges
+    assert '004f' in ranges
+    assert len(ranges) == 15
+
+
+def test_code_ranges_find():
+    """Given whether to find the code points inside and outside of the
+    ranges, :meth:`charex.db.CodeRanges.find` should yield those code
+    points in order.
+    """
+    ranges = db.CodeRanges([(0x0001, 0x0003)])
+    assert list(ranges.find(True, False)) == [0x0001, 0x0002]
+    outside = ranges.find(False, True)
+    assert [next(outside) for _ in range(3)] == [0x0000, 0x0003, 0x0004]
+    assert list(ranges.find(False, False)) == []
+
+
 # Test deserialize.
 def test_deserialize():
     """Given a :class:`charex.db.PathInfo` object,
@@ -118,6 +240,15 @@ def test_get_denormal_map_for_code():
     )
 
 
+def test_get_denormal_map_for_code_shared():
+    """Repeated lookups of the same code point should return the
+    same :class:`tuple`.
+    """
+    code = '00c5'
+    result = db.get_denormal_map_for_code('rev_nfc', code)
+    assert db.get_denormal_map_for_code('rev_nfc', code) is result
+
+
 # Test get_named_sequences:
 def test_get_named_sequences():
     """When called, :funct:`charex.db.get_named_sequences` returns the list
@@ -513,6 +644,16 @@ def test_load_value_aliases():
     assert data['xids']['no'].alias == 'N'
 
 
+def test_load_value_aliases_by_alias():
+    """The value aliases loaded by :func:`charex.db.load_value_aliases`
+    can also be keyed by the alias of each value.
+    """
+    pi = db.PathInfo('PropertyValueAliases.txt', 'UCD.zip', '', ';')
+    data = db.load_value_aliases(pi).by_alias()
+    assert data['gc']['lu'].name == 'Uppercase_Letter'
+    assert data['ahex']['n'].name == 'No'
+
+
 # Test load_value_range.
 def test_load_value_range():
     """When given the information for a path as a :class:`charex.db.PathInfo`
@@ -526,3 +667,136 @@ def test_load_value_range():
         0x100000, 0x110000, 'Supplementary Private Use Area-B'
     )
     assert data[106] == db.ValueRange(0x2fe0, 0x2ff0, 'No_Block')
+
+
+def test_load_value_range_unsorted():
+    """Given a file whose ranges are out of order or are single code
+    points, :func:`charex.db.load_value_range` should return the ranges
+    in order with the gaps filled by the missing value.
+    """
+    pi = db.PathInfo('Scripts.txt', 'UCD.zip', 'value_range', ';')
+    data = db.load_value_range(pi)
+    assert data[0] == db.ValueRange(0x0000, 0x0020, 'Common')
+    assert db.ValueRange(0x00aa, 0x00ab, 'Latin') in data
+    assert data[-1].value == 'Unknown'
+    assert all(a.stop == b.start for a, b in zip(data, data[1:]))
+
+
+# Test parse.
+def test_parse():
+    """Given the lines of a data file, `parse` should return the
+    records without comments or blank lines and the first missing
+    value in the file.
+    """
+    lines = (
+        '# Spam.',
+        '# @missing: 0000..10FFFF; Unknown',
+        '# @missing: 0000..10FFFF; Other',
+        '',
+        '0041..0042 ; Latin # Lu',
+        '0391       ; Greek # Lu',
+    )
+    records, missing = db.parse(lines)
+    assert records == (('0041..0042', 'Latin'), ('0391', 'Greek'))
+    assert missing == 'Unknown'
+
+    records, _ = db.parse(lines, True)
+    assert records == (
+        ('0041', 'Latin'),
+        ('0042', 'Latin'),
+        ('0391', 'Greek'),
+    )
+
+
+# Test parse_unicode_data.
+def test_parse_unicode_data():
+    """Given a line from UnicodeData.txt,
+    :func:`charex.db.parse_unicode_data` should return the record for
+    the line. Fields with few possible values should be shared between
+    records.
+    """
+    a = db.parse_unicode_data('0030;DIGIT ZERO;Nd;0;EN;;0;0;0;N;;;;;')
+    b = db.parse_unicode_data('0031;DIGIT ONE;Nd;0;EN;;1;1;1;N;;;;;')
+    assert a.code == '0030'
+    assert a.na == 'DIGIT ZERO'
+    assert a.nv == '0'
+    assert a.gc is b.gc
+    assert a.bc is b.bc
+
+
+# Test scan_codes.
+def test_scan_codes():
+    """Given a property, a test, a getter, and a key,
+    :func:`charex.db.scan_codes` should yield the code points with
+    values that pass the test, skipping the ones the getter doesn't
+    have a value for.
+    """
+    def getter(prop, code, key):
+        if code == '0042':
+            raise KeyError(code)
+        return 'eggs' if code in ('0041', '0042') else 'spam'
+
+    found = db.scan_codes('spam', lambda v: v == 'eggs', getter, 'bacon')
+    assert list(found) == [0x0041]
+
+
+# Test UnicodeDataMap.
+def test_unicode_data_map():
+    """A :class:`charex.db.UnicodeDataMap` should build the records
+    for code points when they are looked up, including the code points
+    in its ranges.
+    """
+    data = make_unicode_data_map()
+    assert data['3401'].na == 'CJK UNIFIED IDEOGRAPH-3401'
+    assert data['3401'].gc == 'Lo'
+    assert data['0041'].slc == '0061'
+    assert data['3403'].na == '<CJK Ideograph Extension A, Last>'
+    assert '3404' not in data
+    assert list(data) == ['0041', '3400', '3401', '3402', '3403']
+    assert len(data) == 5
+
+
+def test_unicode_data_map_find():
+    """Given a field and a test, :meth:`charex.db.UnicodeDataMap.find`
+    should yield the code points with values in that field that pass
+    the test, including the code points in its ranges.
+    """
+    data = make_unicode_data_map()
+    assert list(data.find('gc', lambda v: v == 'Lo')) == [
+        0x3400, 0x3401, 0x3402, 0x3403
+    ]
+    assert list(data.find('na', lambda v: v.endswith('3401'))) == [0x3401]
+
+
+# Test ValueRangeMap.
+def test_value_range_map():
+    """A :class:`charex.db.ValueRangeMap` should give the value of the
+    range a code point is in, or the missing value if it isn't in a
+    range.
+    """
+    ranges = [(0x0061, 0x0063, 'eggs'), (0x0041, 0x0042, 'spam')]
+    data = db.ValueRangeMap(ranges)
+    assert data['0041'] == 'spam'
+    assert data['0062'] == 'eggs'
+    assert data['0042'] == ''
+    assert '0041' in data
+    assert '0042' not in data
+    assert list(data) == ['0041', '0061', '0062']
+
+
+# Utility functions.
+def make_unicode_data_map():
+    """Build a small :class:`charex.db.UnicodeDataMap` with one line
+    and one range for testing.
+    """
+    first = db.UCD(
+        '3400', '<CJK Ideograph Extension A, First>', 'Lo',
+        *(('',) * 12)
+    )
+    return db.UnicodeDataMap(
+        {
+            '0041': '0041;LATIN CAPITAL LETTER A;Lu;0;L;;;;;N;;;;0061;',
+            '3403': '3403;<CJK Ideograph Extension A, Last>;Lo;0;L;;;;;N;;;;;',
+        },
+        [(0x3400, 0x3403, first)]
+    )
@@ -0,0 +1,50 @@
+"""
+test_init
+~~~~~~~~~
+
+Unit tests for the :mod:`charex` package namespace.
+"""
+import subprocess
+import sys
+
+import pytest
+
+
+# Tests for the package namespace.
+def test_submodule_access():
+    """After `import charex`, the submodules should be reachable as
+    attributes of the package without importing them first. This runs
+    in a fresh interpreter, since the test session has already
+    imported them.
+    """
+    names = (
+        'charex', 'charsets', 'db', 'denormal', 'escape', 'normal', 'util',
+    )
+    code = 'import charex; ' + '; '.join(
+        f'print(charex.{name}.__name__)' for name in names
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == [
+        f'charex.{name}' for name in names
+    ]
+
+
+def test_public_names():
+    """The public API should be available from the package."""
+    import charex
+    assert charex.Character('a').na == 'LATIN SMALL LETTER A'
+    assert charex.escape_text('<', 'url') == '%3C'
+
+
+def test_unknown_name():
+    """Names that are neither public nor a submodule should raise
+    an AttributeError.
+    """
+    import charex
+    with pytest.raises(AttributeError):
+        charex.spam
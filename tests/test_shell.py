@@ -11,6 +11,44 @@ from charex import normal as nl
 from charex import shell as sh
 
 
+# Tests for build_parser.
+def test_build_parser():
+    """When called without a mode, `build_parser` builds the
+    subparsers for every mode.
+    """
+    p = sh.build_parser()
+    assert p.parse_args(['cd', '0x41']).func is sh.mode_cd
+    assert p.parse_args(['vn']).func is sh.mode_vn
+
+
+def test_build_parser_mode(capsys):
+    """When called with the name of a mode, `build_parser` only
+    builds the subparser for that mode.
+    """
+    p = sh.build_parser('dt')
+    assert p.parse_args(['dt', 'A']).func is sh.mode_dt
+    assert p.parse_args(['details', 'A']).func is sh.mode_dt
+    with pytest.raises(SystemExit):
+        p.parse_args(['cd', '0x41'])
+    assert 'invalid choice' in capsys.readouterr().err
+
+
+def test_build_parser_cached():
+    """Parsers are built once and reused by later calls."""
+    assert sh.build_parser() is sh.build_parser()
+    assert sh.build_parser('dt') is sh.build_parser('dt')
+
+
+def test_build_parser_unknown_mode():
+    """When called with something that isn't the name of a mode,
+    `build_parser` builds the subparsers for every mode, so aliases
+    and help still work.
+    """
+    p = sh.build_parser('details')
+    assert p.parse_args(['cd', '0x41']).func is sh.mode_cd
+    assert p.parse_args(['details', 'A']).func is sh.mode_dt
+
+
 # Tests for cd.
 def test_cd(capsys):
     """Invoked with a hex string, `cd` returns the character for
@@ -257,7 +295,6 @@ def test_ns(capsys):
 
 
 # Test pf mode.
-@pytest.mark.skip(reason='Slow.')
 def test_pf(capsys):
     """When invoked, pf mode should return the list characters with the
     given property value.
@@ -278,7 +315,6 @@ def test_pf(capsys):
     shell_test(exp, cmd, capsys)
 
 
-@pytest.mark.skip(reason='Slow.')
 def test_pf_insensitive(capsys):
     """When invoked, pf mode should return the list characters with the
     given property value.
@@ -10,6 +10,25 @@ from charex import util
 
 
 # Test cases.
+# Tests for neutralize_control_characters.
+def test_neutralize_control_characters():
+    """Given a :class:`str`, return the string with the control
+    characters replaced by their Unicode control picture symbols.
+    """
+    exp = '\u2400spam\u240a\u247f'
+    value = '\x00spam\n\x7f'
+    assert util.neutralize_control_characters(value) == exp
+
+
+def test_neutralize_control_characters_no_controls():
+    """Given a :class:`str` without control characters, return the
+    string unchanged.
+    """
+    exp = 'spam \u00e5\u2400'
+    value = 'spam \u00e5\u2400'
+    assert util.neutralize_control_characters(value) == exp
+
+
 # Tests for to_bytes.
 def test_to_bytes():
     """Given a :class:`str` containing a representation of a binary
@@ -88,6 +107,36 @@ def test_hex2bytes_hex_odd_length_little_endian():
     assert act == exp
 
 
+def test_hex2bytes_drops_zero_octets():
+    """Given a :class:`str` containing a representation of a hexadecimal
+    number, octets that are zero are dropped from the result, so the
+    leading zeros of a code point don't become null bytes.
+    """
+    assert util.hex2bytes('0041') == b'\x41'
+    assert util.hex2bytes('4100') == b'\x41'
+    assert util.hex2bytes('BEEF') == b'\xbe\xef'
+    assert util.hex2bytes('') == b''
+
+
+def test_bin2bytes():
+    """Given a :class:`str` containing a representation of a binary
+    number, :func:`charex.util.bin2bytes` should return that number as
+    :class:`bytes`, dropping octets that are zero.
+    """
+    assert util.bin2bytes('0100000101000010') == b'\x41\x42'
+    assert util.bin2bytes('0000000001000001') == b'\x41'
+    assert util.bin2bytes('1') == b'\x01'
+    assert util.bin2bytes('') == b''
+
+
+def test_hex2bytes_invalid():
+    """Given a :class:`str` that isn't a hexadecimal number,
+    :func:`charex.util.hex2bytes` should raise a ValueError.
+    """
+    with pytest.raises(ValueError):
+        util.hex2bytes('spam')
+
+
 def test_to_bytes_int():
     """Given a :class:`int`, :func:`charex.util.bytes` should that
     number as :class:`bytes`.